@@ -1,6 +1,7 @@
 """Configuration handling for PyMailAI."""
 
 from dataclasses import dataclass
+from typing import Any, Callable, Optional
 
 
 @dataclass
@@ -20,13 +21,22 @@ class EmailConfig:
     tls: bool = True
     mark_seen_immediately: bool = True  # Mark messages as seen before processing
 
-    def validate(self) -> None:
-        """Validate configuration settings."""
-        from email_validator import EmailNotValidError, validate_email
+    def validate(self, validator: Optional[Callable[[str], Any]] = None) -> None:
+        """Validate configuration settings.
+
+        Args:
+            validator: Callable that raises ValueError for an invalid email
+                address, ``email_validator.validate_email`` by default
+        """
+        if validator is None:
+            from email_validator import validate_email
+
+            validator = validate_email
 
         try:
-            validate_email(self.email)
-        except EmailNotValidError as e:
+            validator(self.email)
+        except ValueError as e:
+            # email_validator's EmailNotValidError is a ValueError
             raise ValueError(f"Invalid email address: {e}")
 
         if not self.password:
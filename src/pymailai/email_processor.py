@@ -1,57 +1,172 @@
 """Email message processing utilities."""
 
-from email.message import EmailMessage
-from typing import Any, Dict, List, Optional, Tuple
+import base64
+from email.message import EmailMessage, Message
+from tempfile import SpooledTemporaryFile
+from typing import Any, Iterator, List, Mapping, Optional, Tuple, cast
 
 from pymailai.html_converter import HtmlConverter
 from pymailai.text_processor import TextProcessor
 
 
+class LazyAttachment(Mapping[str, Any]):
+    """Attachment of a parsed message whose payload is decoded on access.
+
+    Behaves like the ``{"filename", "content_type", "payload"}`` dicts used
+    for attachments elsewhere, but keeps a reference to the MIME part instead
+    of holding the decoded bytes.
+    """
+
+    __slots__ = ("_part", "filename", "content_type")
+
+    _KEYS = ("filename", "content_type", "payload")
+
+    def __init__(self, part: Message) -> None:
+        """Initialize the attachment from a non-multipart message part.
+
+        Args:
+            part: MIME part holding the attachment
+        """
+        self._part = part
+        self.filename = part.get_filename()
+        self.content_type = part.get_content_type()
+
+    @property
+    def payload(self) -> Any:
+        """Decode and return the attachment payload."""
+        return self._part.get_payload(decode=True)
+
+    def stream(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Decode the payload incrementally.
+
+        Args:
+            chunk_size: Approximate size in bytes of each decoded chunk
+
+        Yields:
+            Consecutive chunks of the decoded payload
+        """
+        if self._part.get("Content-Transfer-Encoding", "").lower() != "base64":
+            payload = self.payload
+            if payload:
+                yield payload
+            return
+
+        encoded = self._part.get_payload()
+        assert isinstance(encoded, str)  # Attachments are never multipart
+        window = max(chunk_size // 3 * 4, 4)
+        pending = b""
+        for start in range(0, len(encoded), window):
+            pending += "".join(encoded[start : start + window].split()).encode()
+            # Only whole 4-character groups can be decoded on their own
+            usable = len(pending) - len(pending) % 4
+            if usable:
+                yield base64.b64decode(pending[:usable])
+                pending = pending[usable:]
+        if pending:
+            yield base64.b64decode(pending + b"=" * (-len(pending) % 4))
+
+    def spool(self, max_size: int = 1 << 20) -> SpooledTemporaryFile:
+        """Decode the payload into a file that spills to disk when large.
+
+        Args:
+            max_size: Size in bytes above which the data is moved to disk
+
+        Returns:
+            File positioned at the start of the decoded payload
+        """
+        spooled = SpooledTemporaryFile(max_size=max_size)
+        for chunk in self.stream():
+            spooled.write(chunk)
+        spooled.seek(0)
+        return spooled
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+    def __repr__(self) -> str:
+        return (
+            f"LazyAttachment(filename={self.filename!r}, "
+            f"content_type={self.content_type!r})"
+        )
+
+
 class EmailProcessor:
     """Handles processing of email message parts."""
 
+    @staticmethod
+    def _iter_leaves(msg: Message) -> Iterator[Message]:
+        """Yield the non-multipart parts of a message in document order."""
+        # get_payload() rather than iter_parts(), which compat32 messages
+        # such as MIMEMultipart do not provide
+        stack = [msg]
+        while stack:
+            part = stack.pop()
+            if part.is_multipart():
+                stack.extend(reversed(cast(List[Message], part.get_payload())))
+            else:
+                yield part
+
+    @staticmethod
+    def _decode_text(part: Message) -> str:
+        """Decode a text part using its declared charset.
+
+        ``get_content()`` is not used as compat32 parts such as ``MIMEText``
+        lack it. Invalid bytes are replaced rather than failing the message.
+        """
+        payload = part.get_payload(decode=True)
+        assert isinstance(payload, bytes)
+        charset = part.get_content_charset() or "utf-8"
+        try:
+            return payload.decode(charset, "replace")
+        except LookupError:
+            # Unknown charset name
+            return payload.decode("utf-8", "replace")
+
     @staticmethod
     def process_message_parts(
         msg: EmailMessage,
-    ) -> Tuple[str, Optional[str], List[Dict[str, Any]]]:
-        """Process message parts and return body text, html and attachments."""
-        body_text_parts = []
+    ) -> Tuple[str, Optional[str], List[Mapping[str, Any]]]:
+        """Process message parts and return body text, html and attachments.
+
+        Attachment payloads are not decoded here; see ``LazyAttachment``.
+        """
+        body_text_parts: List[str] = []
         body_html = None
-        attachments = []
+        attachments: List[Mapping[str, Any]] = []
 
         # Process all parts of the message
         if msg.is_multipart():
             # First pass: collect all parts
-            text_parts = []
-            html_parts = []
-
-            for part in msg.walk():
-                if part.is_multipart():
-                    continue
+            text_parts: List[str] = []
+            html_parts: List[str] = []
+            # Body parts are collected by content type; anything else that is
+            # not an attachment is ignored
+            body_parts = {"text/plain": text_parts, "text/html": html_parts}
 
+            for part in EmailProcessor._iter_leaves(msg):
                 content_type = part.get_content_type()
                 disposition = part.get("Content-Disposition", "")
 
                 if "attachment" in disposition or content_type.startswith("image/"):
-                    attachments.append(
-                        {
-                            "filename": part.get_filename(),
-                            "content_type": content_type,
-                            "payload": part.get_payload(decode=True),
-                        }
-                    )
-                elif content_type == "text/plain":
-                    payload = part.get_payload(decode=True)
-                    assert isinstance(payload, bytes)
-                    text_parts.append(payload.decode())
-                elif content_type == "text/html":
-                    payload = part.get_payload(decode=True)
-                    assert isinstance(payload, bytes)
-                    html_parts.append(payload.decode())
+                    attachments.append(LazyAttachment(part))
+                    continue
+
+                collected = body_parts.get(content_type)
+                if collected is not None:
+                    collected.append(EmailProcessor._decode_text(part))
 
             # Second pass: process collected parts
             if text_parts:
-                body_text_parts.extend(text_parts)
+                # Combined as-is, without copying into a separate list
+                body_text_parts = text_parts
             elif html_parts:
                 # If we only have HTML parts, convert to text while preserving quotes
                 body_text_parts.append(
@@ -63,9 +178,7 @@ class EmailProcessor:
 
         else:
             # Single part message
-            payload = msg.get_payload(decode=True)
-            assert isinstance(payload, bytes)
-            content = payload.decode()
+            content = EmailProcessor._decode_text(msg)
 
             if msg.get_content_type() == "text/html":
                 body_html = content
@@ -1,8 +1,15 @@
 """Email reply building utilities."""
 
+import re
 from datetime import datetime
 from typing import Optional
 
+# Lines with visible content and whitespace-only lines of a quoted body
+_CONTENT_LINE = re.compile(r"^(?=[^\n]*\S)", re.MULTILINE)
+_BLANK_LINE = re.compile(r"^[^\S\n]*$", re.MULTILINE)
+# Line boundaries recognised by str.splitlines() other than "\n"
+_OTHER_LINE_BREAK = re.compile("[\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
 
 class ReplyBuilder:
     """Handles building email replies."""
@@ -22,22 +29,29 @@ class ReplyBuilder:
             return reply_text
 
         prefix = ">" * quote_level
-        quoted_header = [
-            "",
-            "",
-            f"{prefix} -------- Original Message --------",
-            f"{prefix} Subject: {subject}",
-            f"{prefix} Date: "
-            f"{timestamp.strftime('%b %d, %Y, at %I:%M %p') if timestamp else 'N/A'}",
-            f"{prefix} From: {from_address}",
-            prefix,
-        ]
-
-        quoted_body = []
-        for line in original_text.splitlines():
-            if line.startswith(">"):
-                quoted_body.append(f"{prefix} {line}")
-            else:
-                quoted_body.append(f"{prefix} {line}" if line.strip() else prefix)
-
-        return reply_text + "\n".join(quoted_header + quoted_body)
+        date = timestamp.strftime("%b %d, %Y, at %I:%M %p") if timestamp else "N/A"
+        quoted_header = (
+            f"\n\n{prefix} -------- Original Message --------"
+            f"\n{prefix} Subject: {subject}"
+            f"\n{prefix} Date: {date}"
+            f"\n{prefix} From: {from_address}"
+            f"\n{prefix}"
+        )
+
+        if not original_text:
+            return reply_text + quoted_header
+
+        # Normalise line breaks to "\n" the way splitlines() would, skipping
+        # the per-line copies when the text has nothing to normalise
+        if _OTHER_LINE_BREAK.search(original_text):
+            body = "\n".join(original_text.splitlines())
+        elif original_text.endswith("\n"):
+            body = original_text[:-1]
+        else:
+            body = original_text
+
+        # Prefix content lines with "> " and replace blank lines by ">"
+        quoted_body = _CONTENT_LINE.sub(prefix + " ", body)
+        quoted_body = _BLANK_LINE.sub(prefix, quoted_body)
+
+        return f"{reply_text}{quoted_header}\n{quoted_body}"
@@ -1,7 +1,7 @@
 """Email field validation utilities."""
 
 import re
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 
 
 class EmailValidator:
@@ -18,3 +18,20 @@ class EmailValidator:
     def validate_addresses(cls, addresses: List[str]) -> bool:
         """Validate list of email addresses."""
         return all(cls.validate_email(addr) for addr in addresses if addr)
+
+    @classmethod
+    def validate_many(cls, *groups: Iterable[str]) -> Tuple[bool, Optional[str]]:
+        """Validate several groups of email addresses in one pass.
+
+        Args:
+            *groups: Iterables of addresses; empty addresses are skipped
+
+        Returns:
+            Tuple of (all_valid, first_invalid_address)
+        """
+        match = cls.EMAIL_REGEX.match
+        for group in groups:
+            for addr in group:
+                if addr and not match(addr):
+                    return False, addr
+        return True, None
@@ -1,10 +1,23 @@
 """Gmail API client implementation."""
 
-import base64
+import asyncio
+import io
 import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from email import utils
-from typing import AsyncGenerator, Optional, Tuple
+from email.generator import BytesGenerator
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Deque, Dict, Optional, Tuple
+
+try:
+    # SIMD-accelerated drop-ins for the stdlib codecs, used when installed
+    from pybase64 import urlsafe_b64decode as _b64decode
+    from pybase64 import urlsafe_b64encode as _b64encode
+except ImportError:  # pragma: no cover - depends on optional extra
+    from base64 import urlsafe_b64decode as _b64decode
+    from base64 import urlsafe_b64encode as _b64encode
 
 from pymailai.base_client import BaseEmailClient
 from pymailai.email_reply import ReplyBuilder
@@ -13,31 +26,57 @@ from pymailai.text_processor import TextProcessor
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of calls the Gmail API accepts in a single batch request
+_BATCH_SIZE = 100
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> datetime:
+    """Parse an RFC 2822 Date header, reusing results for repeated headers."""
+    return utils.parsedate_to_datetime(date_str)
+
 
 class GmailClient(BaseEmailClient):
     """Asynchronous Gmail client using the Gmail API."""
 
-    def __init__(self, service):
-        """Initialize Gmail client with service."""
+    def __init__(self, service, max_workers: int = 1):
+        """Initialize Gmail client with service.
+
+        Blocking API requests run on a worker thread, so they do not block the
+        event loop. With the default single worker they still run one at a
+        time and never overlap each other. The pool is shut down by
+        ``disconnect()``.
+
+        Args:
+            service: Gmail API service resource
+            max_workers: Number of threads executing blocking API requests.
+                The service sends every request through one httplib2.Http
+                object, which is not thread safe. Only raise this when every
+                worker executes requests with its own thread-safe ``http``.
+        """
         self.service = service
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     async def connect(self) -> None:
         """No connection needed for Gmail API."""
         logger.info("Gmail API client ready")
 
     async def disconnect(self) -> None:
-        """No disconnection needed for Gmail API."""
+        """Shut down the request thread pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         logger.info("Gmail API client closed")
 
     async def fetch_new_messages(self) -> AsyncGenerator[EmailData, None]:
         """Fetch new unread messages using Gmail API."""
         try:
             # Search for unread messages
-            results = (
+            results = await self._aexecute(
                 self.service.users()
                 .messages()
                 .list(userId="me", q="is:unread -in:chats")
-                .execute()
             )
 
             messages = results.get("messages")
@@ -47,40 +86,53 @@ class GmailClient(BaseEmailClient):
 
             logger.info(f"Found {len(messages)} unread messages")
 
+            # Get every unread message in full
+            full_messages = await self._execute_batch(
+                {
+                    message["id"]: self.service.users()
+                    .messages()
+                    .get(userId="me", id=message["id"], format="full")
+                    for message in messages
+                }
+            )
+
+            # Only replies can have earlier messages in their thread, so the
+            # full thread is fetched for those alone, once per thread
+            thread_ids = {
+                msg["threadId"] for msg in full_messages.values() if self._is_reply(msg)
+            }
+            threads = await self._execute_batch(
+                {
+                    thread_id: self.service.users()
+                    .threads()
+                    .get(userId="me", id=thread_id)
+                    for thread_id in thread_ids
+                }
+            )
+
             for message in messages:
-                try:
-                    # Get the thread ID first
-                    msg = (
-                        self.service.users()
-                        .messages()
-                        .get(
-                            userId="me",
-                            id=message["id"],
-                            format="metadata",
-                            metadataHeaders=["threadId"],
-                        )
-                        .execute()
-                    )
+                msg = full_messages.get(message["id"])
+                if msg is None:
+                    logger.warning(f"Skipping message {message['id']}: lookup failed")
+                    continue
 
-                    # Get all messages in the thread
-                    thread = (
-                        self.service.users()
-                        .threads()
-                        .get(userId="me", id=msg["threadId"])
-                        .execute()
-                    )
+                try:
+                    # Without its thread, a reply is processed on its own
+                    thread = threads.get(msg["threadId"], {"messages": [msg]})
 
-                    # Process all messages in the thread to build conversation history
-                    thread_parts = []
-                    thread_html_parts = []
+                    # Process all messages in the thread to build conversation
+                    # history; parts are prepended so the newest comes first
+                    thread_parts: Deque[str] = deque()
+                    thread_html_parts: Deque[str] = deque()
 
                     # Process messages in chronological order (oldest first)
                     messages_in_thread = thread["messages"]
                     is_conversation = len(messages_in_thread) > 1
+                    headers: Dict[str, str] = {}
 
                     for thread_msg in messages_in_thread:
                         headers = {
-                            h["name"]: h["value"]
+                            h["name"].lower(): h["value"]
                             for h in thread_msg["payload"]["headers"]
                         }
                         msg_text, msg_html = self._extract_message_content(
@@ -93,44 +145,44 @@ class GmailClient(BaseEmailClient):
                             )
                             if is_conversation:
                                 # Parse timestamp from headers
-                                date_str = headers.get("Date")
+                                date_str = headers.get("date")
                                 if date_str:
-                                    timestamp = utils.parsedate_to_datetime(date_str)
+                                    timestamp = _parse_date(date_str)
                                 else:
                                     timestamp = datetime.fromtimestamp(
                                         int(thread_msg["internalDate"]) / 1000
                                     )
 
                                 # Use ReplyBuilder to format the message
-                                thread_parts.append(
+                                thread_parts.appendleft(
                                     ReplyBuilder.build_reply_body(
                                         original_text=processed_text,
                                         reply_text="",
-                                        subject=headers.get("Subject", ""),
+                                        subject=headers.get("subject", ""),
                                         timestamp=timestamp,
-                                        from_address=headers.get("From", ""),
+                                        from_address=headers.get("from", ""),
                                     )
                                 )
                             else:
-                                thread_parts.append(processed_text)
+                                thread_parts.appendleft(processed_text)
 
                         if msg_html:
                             if is_conversation:
                                 # Parse timestamp from headers
-                                date_str = headers.get("Date")
+                                date_str = headers.get("date")
                                 if date_str:
-                                    timestamp = utils.parsedate_to_datetime(date_str)
+                                    timestamp = _parse_date(date_str)
                                 else:
                                     timestamp = datetime.fromtimestamp(
                                         int(thread_msg["internalDate"]) / 1000
                                     )
 
                                 # Add HTML with quote formatting
-                                thread_html_parts.append(
+                                thread_html_parts.appendleft(
                                     f'<div class="email-quote">{msg_html}</div>'
                                 )
                             else:
-                                thread_html_parts.append(msg_html)
+                                thread_html_parts.appendleft(msg_html)
                         elif (
                             msg_text
                             and not msg_html
@@ -139,28 +191,23 @@ class GmailClient(BaseEmailClient):
                             .startswith("multipart/")
                         ):
                             # Only convert text to HTML for multipart messages
-                            thread_html_parts.append(f"<pre>{msg_text}</pre>")
+                            thread_html_parts.appendleft(f"<pre>{msg_text}</pre>")
 
-                    # Use the last message's headers for the email metadata
-                    last_msg = thread["messages"][-1]
-                    headers = {
-                        h["name"]: h["value"] for h in last_msg["payload"]["headers"]
-                    }
+                    # The loop leaves the last message's headers in place, and
+                    # those are used for the email metadata
 
                     # Combine thread history
-                    body_text = TextProcessor.combine_text_parts(
-                        list(reversed(thread_parts))
-                    )
+                    body_text = TextProcessor.combine_text_parts(thread_parts)
                     body_html = (
-                        "<br><br>".join(reversed(thread_html_parts))
+                        "<br><br>".join(thread_html_parts)
                         if thread_html_parts
                         else None
                     )
 
                     # Parse timestamp from headers or use message internal date
-                    date_str = headers.get("Date")
+                    date_str = headers.get("date")
                     if date_str:
-                        timestamp = utils.parsedate_to_datetime(date_str)
+                        timestamp = _parse_date(date_str)
                     else:
                         # Use internal date (Unix timestamp in seconds)
                         timestamp = datetime.fromtimestamp(
@@ -170,27 +217,24 @@ class GmailClient(BaseEmailClient):
                     # Create EmailData with the original unread message ID
                     email_data = EmailData(
                         message_id=message["id"],  # Use the original unread message ID
-                        subject=headers.get("Subject", ""),
-                        from_address=headers.get("From", ""),
+                        subject=headers.get("subject", ""),
+                        from_address=headers.get("from", ""),
                         to_addresses=[
-                            addr.strip()
-                            for addr in headers.get("To", "").split(",")
-                            if addr.strip()
+                            addr
+                            for _, addr in utils.getaddresses([headers.get("to", "")])
+                            if addr
                         ],
                         cc_addresses=[
-                            addr.strip()
-                            for addr in headers.get("Cc", "").split(",")
-                            if addr.strip()
+                            addr
+                            for _, addr in utils.getaddresses([headers.get("cc", "")])
+                            if addr
                         ],
                         body_text=body_text or "",
                         body_html=body_html,
                         timestamp=timestamp,
-                        references=[
-                            ref.strip()
-                            for ref in headers.get("References", "").split()
-                            if ref.strip()
-                        ],
-                        in_reply_to=headers.get("In-Reply-To", ""),
+                        references=headers.get("references", "").split(),
+                        in_reply_to=headers.get("in-reply-to", ""),
+                        labels=frozenset(msg.get("labelIds", ())),
                     )
                     yield email_data
 
@@ -201,26 +245,96 @@ class GmailClient(BaseEmailClient):
         except Exception as e:
             logger.error(f"Failed to fetch messages: {str(e)}")
 
+    @staticmethod
+    def _is_reply(msg: dict) -> bool:
+        """Check whether a full Gmail message replies to an earlier message."""
+        return any(
+            header["name"].lower() in ("in-reply-to", "references") and header["value"]
+            for header in msg["payload"]["headers"]
+        )
+
+    async def _aexecute(self, request: Any) -> Any:
+        """Execute a blocking Gmail API request without blocking the event loop.
+
+        Requests are queued on the client's thread pool, which runs them one
+        at a time with the default single worker.
+
+        Args:
+            request: Unexecuted Gmail API request or batch request
+
+        Returns:
+            The response of the request
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="gmail"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, request.execute)
+
+    async def _execute_batch(self, requests: Dict[str, Any]) -> Dict[str, dict]:
+        """Execute Gmail API requests using batch HTTP requests.
+
+        Args:
+            requests: Mapping of request ID to an unexecuted API request
+
+        Returns:
+            Mapping of request ID to response for the requests that succeeded
+        """
+        responses: Dict[str, dict] = {}
+
+        def callback(request_id: str, response: dict, exception: Any) -> None:
+            if exception is not None:
+                logger.error(f"Batch request {request_id} failed: {str(exception)}")
+            else:
+                responses[request_id] = response
+
+        items = list(requests.items())
+        for start in range(0, len(items), _BATCH_SIZE):
+            chunk = items[start : start + _BATCH_SIZE]
+            try:
+                batch = self.service.new_batch_http_request(callback=callback)
+                for request_id, request in chunk:
+                    batch.add(request, request_id=request_id)
+                await self._aexecute(batch)
+            except Exception as e:
+                logger.warning(
+                    f"Batch request failed, falling back to single requests: {str(e)}"
+                )
+                # The service shares one HTTP connection that is not thread
+                # safe, so the remaining requests are executed one at a time
+                for request_id, request in chunk:
+                    if request_id in responses:
+                        continue
+                    try:
+                        responses[request_id] = await self._aexecute(request)
+                    except Exception as request_error:
+                        callback(request_id, {}, request_error)
+
+        return responses
+
     async def send_message(self, message: EmailData) -> None:
         """Send an email message via Gmail API."""
         try:
             # Convert to EmailMessage
             email_message = message.to_email_message()
 
-            # Encode the message
-            encoded_message = base64.urlsafe_b64encode(
-                email_message.as_bytes()
-            ).decode()
+            # Serialize into a buffer and encode its contents in place,
+            # instead of copying them into an intermediate bytes object
+            buffer = io.BytesIO()
+            BytesGenerator(
+                buffer, mangle_from_=False, policy=email_message.policy
+            ).flatten(email_message)
+            with buffer.getbuffer() as raw:
+                encoded: bytes = _b64encode(raw)
+            encoded_message = encoded.decode("ascii")
 
             # Create the Gmail API message
             gmail_message = {"raw": encoded_message}
 
             # Send the message
-            result = (
-                self.service.users()
-                .messages()
-                .send(userId="me", body=gmail_message)
-                .execute()
+            result = await self._aexecute(
+                self.service.users().messages().send(userId="me", body=gmail_message)
             )
 
             logger.info(f"Message sent successfully with ID: {result.get('id')}")
@@ -237,11 +351,15 @@ class GmailClient(BaseEmailClient):
         """
         try:
             # Directly modify the message using its Gmail ID
-            self.service.users().messages().modify(
-                userId="me",
-                id=message_id,
-                body={"removeLabelIds": ["UNREAD"]},
-            ).execute()
+            await self._aexecute(
+                self.service.users()
+                .messages()
+                .modify(
+                    userId="me",
+                    id=message_id,
+                    body={"removeLabelIds": ["UNREAD"]},
+                )
+            )
             logger.info(f"Marked message {message_id} as read")
         except Exception as e:
             logger.error(f"Failed to mark message as read: {str(e)}")
@@ -267,35 +385,28 @@ class GmailClient(BaseEmailClient):
             """Decode content from a message part."""
             data = part.get("body", {}).get("data", "")
             if data:
-                return base64.urlsafe_b64decode(data).decode()
+                # Gmail bodies are ASCII base64; decoding from bytes skips the
+                # str-to-bytes conversion b64decode would otherwise perform
+                raw: bytes = _b64decode(data.encode("ascii"))
+                return raw.decode("utf-8", "replace")
             return None
 
-        def extract_content_recursive(
-            part: dict,
-        ) -> Tuple[Optional[str], Optional[str]]:
-            """Recursively extract text and HTML content from message parts."""
+        # Depth-first walk with an explicit stack; children are pushed in
+        # reverse so the first text and HTML parts in document order win
+        text: Optional[str] = None
+        html: Optional[str] = None
+        stack = [payload]
+        while stack and not (text and html):
+            part = stack.pop()
             mime_type = part.get("mimeType", "")
-
             if mime_type.startswith("multipart/"):
-                text = None
-                html = None
-                for subpart in part.get("parts", []):
-                    subtext, subhtml = extract_content_recursive(subpart)
-                    if subtext and not text:
-                        text = subtext
-                    if subhtml and not html:
-                        html = subhtml
-                return text, html
-            else:
-                content = decode_part(part)
-                if content:
-                    if mime_type == "text/plain":
-                        return content, None
-                    elif mime_type == "text/html":
-                        return None, content
-            return None, None
+                stack.extend(reversed(part.get("parts", [])))
+            elif mime_type == "text/plain" and not text:
+                text = decode_part(part)
+            elif mime_type == "text/html" and not html:
+                html = decode_part(part)
 
-        return extract_content_recursive(payload)
+        return text, html
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Async context manager exit."""
@@ -328,7 +439,9 @@ class GmailClient(BaseEmailClient):
             logger.info(f"Executing Gmail query: {q}")
 
             # Execute search
-            results = self.service.users().messages().list(userId="me", q=q).execute()
+            results = await self._aexecute(
+                self.service.users().messages().list(userId="me", q=q)
+            )
 
             messages = results.get("messages", [])
             if not messages:
@@ -337,33 +450,42 @@ class GmailClient(BaseEmailClient):
 
             logger.info(f"Found {len(messages)} matching messages")
 
-            for message in messages:
-                try:
-                    # Get full message data if body is requested, otherwise just metadata
-                    msg = (
-                        self.service.users()
-                        .messages()
-                        .get(
-                            userId="me",
-                            id=message["id"],
-                            format="full"
-                            if query_params.get("include_body")
-                            else "metadata",
-                            metadataHeaders=[
-                                "Subject",
-                                "From",
-                                "To",
-                                "Cc",
-                                "Date",
-                                "References",
-                                "In-Reply-To",
-                            ],
-                        )
-                        .execute()
+            # Get full message data if body is requested, otherwise just metadata
+            full_messages = await self._execute_batch(
+                {
+                    message["id"]: self.service.users()
+                    .messages()
+                    .get(
+                        userId="me",
+                        id=message["id"],
+                        format=(
+                            "full" if query_params.get("include_body") else "metadata"
+                        ),
+                        metadataHeaders=[
+                            "Subject",
+                            "From",
+                            "To",
+                            "Cc",
+                            "Date",
+                            "References",
+                            "In-Reply-To",
+                        ],
                     )
+                    for message in messages
+                }
+            )
 
+            for message in messages:
+                msg = full_messages.get(message["id"])
+                if msg is None:
+                    logger.warning(f"Skipping message {message['id']}: lookup failed")
+                    continue
+
+                try:
                     # Extract headers
-                    headers = {h["name"]: h["value"] for h in msg["payload"]["headers"]}
+                    headers = {
+                        h["name"].lower(): h["value"] for h in msg["payload"]["headers"]
+                    }
 
                     # Extract body content if requested
                     body_text = None
@@ -374,9 +496,9 @@ class GmailClient(BaseEmailClient):
                         )
 
                     # Parse timestamp
-                    date_str = headers.get("Date")
+                    date_str = headers.get("date")
                     if date_str:
-                        timestamp = utils.parsedate_to_datetime(date_str)
+                        timestamp = _parse_date(date_str)
                     else:
                         timestamp = datetime.fromtimestamp(
                             int(msg["internalDate"]) / 1000
@@ -385,27 +507,24 @@ class GmailClient(BaseEmailClient):
                     # Create EmailData
                     email_data = EmailData(
                         message_id=message["id"],
-                        subject=headers.get("Subject", ""),
-                        from_address=headers.get("From", ""),
+                        subject=headers.get("subject", ""),
+                        from_address=headers.get("from", ""),
                         to_addresses=[
-                            addr.strip()
-                            for addr in headers.get("To", "").split(",")
-                            if addr.strip()
+                            addr
+                            for _, addr in utils.getaddresses([headers.get("to", "")])
+                            if addr
                         ],
                         cc_addresses=[
-                            addr.strip()
-                            for addr in headers.get("Cc", "").split(",")
-                            if addr.strip()
+                            addr
+                            for _, addr in utils.getaddresses([headers.get("cc", "")])
+                            if addr
                         ],
                         body_text=body_text or "",
                         body_html=body_html,
                         timestamp=timestamp,
-                        references=[
-                            ref.strip()
-                            for ref in headers.get("References", "").split()
-                            if ref.strip()
-                        ],
-                        in_reply_to=headers.get("In-Reply-To", ""),
+                        references=headers.get("references", "").split(),
+                        in_reply_to=headers.get("in-reply-to", ""),
+                        labels=frozenset(msg.get("labelIds", ())),
                     )
                     yield email_data
 
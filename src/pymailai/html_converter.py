@@ -1,8 +1,23 @@
 """HTML to text conversion utilities with quote preservation."""
 
-from typing import List, Tuple
+import re
+from itertools import islice
+from typing import ClassVar, FrozenSet, List, Set, Tuple
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+# Start of every line, used to prefix whole quotes in one pass
+_LINE_START = re.compile(r"^", re.MULTILINE)
+
+# ASCII whitespace runs inside text nodes, collapsed to one space like
+# browsers do; non-breaking spaces are kept
+_WHITESPACE = re.compile(r"[ \t\r\n\f]+")
+
+# Elements whose text keeps its whitespace as written
+_PREFORMATTED = frozenset({"pre", "textarea"})
+
+# Spaces around line breaks, or repeated where adjacent text nodes meet
+_EXTRA_SPACES = re.compile(r" *\n *| {2,}")
 
 
 class HtmlConverter:
@@ -18,9 +33,11 @@ class HtmlConverter:
         ".outlook_quote",  # Outlook
         'div[data-marker="__QUOTED_TEXT__"]',  # Generic quote marker
     ]
+    _QUOTE_SELECTOR_STR: ClassVar[str] = ", ".join(QUOTE_SELECTORS)
 
     # HTML elements that may contain text content
     TEXT_ELEMENTS = ["p", "div", "span", "pre"]
+    _TEXT_ELEMENT_SET: ClassVar[FrozenSet[str]] = frozenset(TEXT_ELEMENTS)
 
     @classmethod
     def convert_html_to_text(cls, html_content: str) -> str:
@@ -32,8 +49,8 @@ class HtmlConverter:
         Returns:
             Converted text with preserved quote formatting
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-        main_text, quotes = cls._extract_content_and_quotes(soup)
+        tree = LexborHTMLParser(html_content)
+        main_text, quotes = cls._extract_content_and_quotes(tree)
 
         # Combine main content with quotes
         parts = []
@@ -42,55 +59,104 @@ class HtmlConverter:
 
         # Format and add quotes
         for quote in quotes:
-            formatted_quote = "\n".join("> " + line for line in quote.split("\n"))
-            parts.append(formatted_quote)
+            parts.append(_LINE_START.sub("> ", quote))
 
         return "\n\n".join(parts)
 
     @classmethod
-    def _extract_content_and_quotes(cls, soup: BeautifulSoup) -> Tuple[str, List[str]]:
+    def _extract_content_and_quotes(
+        cls, tree: LexborHTMLParser
+    ) -> Tuple[str, List[str]]:
         """Extract main content and quoted text from HTML.
 
         Args:
-            soup: BeautifulSoup object of the HTML content
+            tree: Parsed HTML document
 
         Returns:
             Tuple of (main_text, list_of_quotes)
         """
         quotes = []
 
+        # Only outermost matches are quotes; nested matches belong to them
+        outer_quotes: List[LexborNode] = []
+        outer_ids: Set[int] = set()
+        for quote in tree.css(cls._QUOTE_SELECTOR_STR):
+            if not cls._has_ancestor(quote, outer_ids):
+                outer_quotes.append(quote)
+                outer_ids.add(quote.mem_id)
+
         # Extract quotes first
-        for quote in soup.select(", ".join(cls.QUOTE_SELECTORS)):
+        for quote in outer_quotes:
             quote_text = cls._extract_text_from_element(quote)
             if quote_text.strip():
                 quotes.append(quote_text.strip())
-            quote.decompose()  # Remove quote from soup
+            quote.decompose()  # Remove quote from tree
 
         # Extract remaining main content
-        main_text = cls._extract_text_from_element(soup)
+        main_text = cls._extract_text_from_element(tree.root) if tree.root else ""
 
         return main_text, quotes
 
+    @staticmethod
+    def _has_ancestor(node: LexborNode, mem_ids: Set[int]) -> bool:
+        """Check whether any ancestor of a node is one of the given nodes."""
+        parent = node.parent
+        while parent is not None:
+            if parent.mem_id in mem_ids:
+                return True
+            parent = parent.parent
+        return False
+
     @classmethod
-    def _extract_text_from_element(cls, element: BeautifulSoup) -> str:
+    def _extract_text_from_element(cls, element: LexborNode) -> str:
         """Extract text content from an HTML element, preserving basic structure.
 
         Args:
-            element: BeautifulSoup element to extract text from
+            element: HTML node to extract text from
 
         Returns:
             Extracted text with preserved line breaks
         """
-        text = ""
-        for child in element.descendants:
-            if child.name == "br":
-                text += "\n"
-            elif child.name in cls.TEXT_ELEMENTS:
-                text += "\n"
-                if child.get("class") and any(
-                    "quote" in cls for cls in child.get("class")
-                ):
-                    text += "> "
-            elif child.string:
-                text += child.string.strip()
-        return text
+        # Collapsed text is gathered in parts and cleaned up before each run
+        # of preformatted text, which goes to segments unchanged
+        segments: List[str] = []
+        parts: List[str] = []
+        text_elements = cls._TEXT_ELEMENT_SET
+        # traverse() yields the element itself first, which is skipped
+        for child in islice(element.traverse(include_text=True), 1, None):
+            tag = child.tag
+            if tag == "-text":
+                text = child.text_content or ""
+                if cls._is_preformatted(child):
+                    segments.append(cls._clean_spaces(parts))
+                    segments.append(text)
+                    parts = []
+                else:
+                    parts.append(_WHITESPACE.sub(" ", text))
+            elif tag == "br":
+                parts.append("\n")
+            elif tag in text_elements:
+                parts.append("\n")
+                # A substring test on the raw attribute matches any class
+                # name containing "quote", without splitting the class list
+                if "quote" in (child.attributes.get("class") or ""):
+                    parts.append("> ")
+        segments.append(cls._clean_spaces(parts))
+        return "".join(segments)
+
+    @staticmethod
+    def _is_preformatted(node: LexborNode) -> bool:
+        """Check whether a node is inside an element that keeps whitespace."""
+        parent = node.parent
+        while parent is not None:
+            if parent.tag in _PREFORMATTED:
+                return True
+            parent = parent.parent
+        return False
+
+    @staticmethod
+    def _clean_spaces(parts: List[str]) -> str:
+        """Join collapsed text, dropping spaces around and between line breaks."""
+        return _EXTRA_SPACES.sub(
+            lambda match: "\n" if "\n" in match.group() else " ", "".join(parts)
+        )
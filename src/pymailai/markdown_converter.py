@@ -1,12 +1,20 @@
 """Module for converting markdown content to HTML."""
-from typing import List, Optional
+from typing import ClassVar, Dict, List, Optional, Tuple
 
 import markdown  # type: ignore
 from markdown.core import Markdown  # type: ignore
 
 
 class MarkdownConverter:
-    """Converts markdown content to HTML."""
+    """Converts markdown content to HTML.
+
+    ``Markdown`` instances are shared between converters using the same
+    extensions, so a converter must not be used from several threads at once.
+    """
+
+    # Loading extensions (codehilite pulls in Pygments) is costly, so
+    # instances are built once per extension set and reset between documents
+    _MD_CACHE: ClassVar[Dict[Tuple[str, ...], Markdown]] = {}
 
     def __init__(self, extensions: Optional[List[str]] = None):
         """Initialize the markdown converter.
@@ -20,7 +28,11 @@ class MarkdownConverter:
             "codehilite",
             "nl2br",
         ]
-        self.md: Markdown = markdown.Markdown(extensions=self.extensions)
+        key = tuple(sorted(self.extensions))
+        md = self._MD_CACHE.get(key)
+        if md is None:
+            md = self._MD_CACHE[key] = markdown.Markdown(extensions=self.extensions)
+        self.md: Markdown = md
 
     def convert(self, content: str) -> str:
         """Convert markdown content to HTML.
@@ -31,6 +43,7 @@ class MarkdownConverter:
         Returns:
             The HTML representation of the markdown content.
         """
+        self.md.reset()
         result = self.md.convert(content)
         assert isinstance(result, str)  # Runtime check for mypy
         return result
@@ -1,10 +1,23 @@
 """Email message data structures and utilities."""
 
+import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from email import utils
 from email.message import EmailMessage
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from pymailai.email_processor import EmailProcessor
 from pymailai.email_reply import ReplyBuilder
@@ -12,24 +25,149 @@ from pymailai.email_validator import EmailValidator
 from pymailai.markdown_converter import MarkdownConverter
 
 
-@dataclass
+class _Unset:
+    """Marker for a field that has not been assigned yet."""
+
+    def __repr__(self) -> str:
+        return "<unset>"
+
+
+_UNSET = _Unset()
+
+# Default of EmailData arguments that are parsed from the source message, or
+# set to their empty default without one, when left out
+_LAZY: Any = _UNSET
+
+# Fields compared by EmailData.__eq__, including the lazily parsed ones
+_COMPARED_FIELDS = (
+    "message_id",
+    "subject",
+    "from_address",
+    "to_addresses",
+    "cc_addresses",
+    "body_text",
+    "body_html",
+    "timestamp",
+    "references",
+    "in_reply_to",
+    "attachments",
+    "labels",
+)
+
+
+# Headers read by EmailData.from_email_message, by lowercased name
+_HEADER_FIELDS = frozenset(
+    {"message-id", "subject", "from", "to", "cc", "references", "in-reply-to"}
+)
+
+# Subject prefix of replies
+_REPLY_PREFIX = "Re: "
+
+# Any of these anywhere in a plain text body marks it as markdown
+_MARKDOWN_MARKER = re.compile(r"```|\*\*|__|[#>\-]")
+
+DateTuple = Tuple[int, int, int, int, int, int, int, int, int, Optional[int]]
+
+
+@lru_cache(maxsize=1)
+def _markdown_converter() -> MarkdownConverter:
+    """Return the converter shared by all messages."""
+    return MarkdownConverter()
+
+
+@lru_cache(maxsize=128)
+def _markdown_to_html(text: str) -> str:
+    """Convert markdown to HTML, reusing results for repeated bodies."""
+    return _markdown_converter().convert(text)
+
+
+@lru_cache(maxsize=1)
+def _current_date_tuple(timestamp: int) -> DateTuple:
+    """Build the date tuple of a time, reused for calls within the same second."""
+    date_tuple = utils.parsedate_tz(utils.formatdate(timestamp, localtime=True))
+    assert date_tuple is not None  # formatdate() always returns a valid date string
+    return date_tuple
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_tuple(date_str: str) -> Optional[DateTuple]:
+    """Parse an RFC 2822 Date header, reusing results for repeated headers."""
+    return utils.parsedate_tz(date_str)
+
+
+@dataclass(slots=True, init=False)
 class EmailData:
-    """Represents processed email data."""
+    """Represents processed email data.
+
+    Instances created with ``from_email_message`` keep a reference to the
+    original message until its body, attachments and date have been read.
+    """
 
     message_id: str
     subject: str
     from_address: str
     to_addresses: List[str]
-    cc_addresses: List[str] = field(default_factory=list)
-    body_text: str = ""
-    body_html: Optional[str] = None
-    timestamp: datetime = field(default_factory=datetime.now)
-    references: List[str] = field(default_factory=list)
-    in_reply_to: Optional[str] = None
-    attachments: List[Dict[str, Any]] = field(default_factory=list)
-
-    def __post_init__(self) -> None:
-        """Initialize and validate email data."""
+    cc_addresses: List[str]
+    references: List[str]
+    in_reply_to: Optional[str]
+    # Mailbox labels such as "UNREAD", for clients that provide them
+    labels: Optional[FrozenSet[str]]
+    # Backing fields of the properties parsed lazily from _source
+    _body_text: Union[str, _Unset] = field(repr=False, compare=False)
+    _body_html: Union[Optional[str], _Unset] = field(repr=False, compare=False)
+    _timestamp: Union[datetime, _Unset] = field(repr=False, compare=False)
+    _attachments: Union[List[Mapping[str, Any]], _Unset] = field(
+        repr=False, compare=False
+    )
+    _source: Optional[EmailMessage] = field(repr=False, compare=False)
+    # Derived from the fields above on demand, reset by their setters
+    _html_content: Union[Optional[str], _Unset] = field(repr=False, compare=False)
+    _timestamp_iso: Union[Optional[str], _Unset] = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        message_id: str,
+        subject: str,
+        from_address: str,
+        to_addresses: List[str],
+        cc_addresses: Optional[List[str]] = None,
+        body_text: str = _LAZY,
+        body_html: Optional[str] = _LAZY,
+        timestamp: datetime = _LAZY,
+        references: Optional[List[str]] = None,
+        in_reply_to: Optional[str] = None,
+        attachments: List[Mapping[str, Any]] = _LAZY,
+        source: Optional[EmailMessage] = None,
+        labels: Optional[FrozenSet[str]] = None,
+    ) -> None:
+        """Initialize and validate email data.
+
+        The body, timestamp and attachments are parsed from ``source`` on
+        first access when left out. Without a source they default to an empty
+        body, the current time and no attachments.
+        """
+        self.message_id = message_id
+        self.subject = subject
+        self.from_address = from_address
+        self.to_addresses = to_addresses
+        self.cc_addresses = [] if cc_addresses is None else cc_addresses
+        self.references = [] if references is None else references
+        self.in_reply_to = in_reply_to
+        self.labels = labels
+        self._body_text = body_text
+        self._body_html = body_html
+        self._timestamp = timestamp
+        self._attachments = attachments
+        self._source = source
+        self._html_content = _UNSET
+        self._timestamp_iso = _UNSET
+        if source is None:
+            # Nothing to parse later, so resolve defaults at construction time
+            self._load_parts()
+            self._load_timestamp()
+        else:
+            self._release_source()
+
         # Ensure references is a list of strings
         if not isinstance(self.references, list):
             raise ValueError("References must be a list of strings")
@@ -37,7 +175,14 @@ class EmailData:
         # Clean up reference strings
         self.references = [ref.strip() for ref in self.references if ref]
 
-        # Validate non-empty addresses
+        # Validate non-empty addresses in one pass; the per-field checks only
+        # run to report which field holds an invalid address
+        valid, _ = EmailValidator.validate_many(
+            (self.from_address,), self.to_addresses or (), self.cc_addresses or ()
+        )
+        if valid:
+            return
+
         if self.from_address and not EmailValidator.validate_email(self.from_address):
             raise ValueError(f"Invalid from address: {self.from_address}")
 
@@ -53,44 +198,142 @@ class EmailData:
 
     @classmethod
     def from_email_message(cls, msg: EmailMessage) -> "EmailData":
-        """Create EmailData from an EmailMessage object."""
-        body_text, body_html, attachments = EmailProcessor.process_message_parts(msg)
+        """Create EmailData from an EmailMessage object.
+
+        The message body, attachments and date are parsed lazily on first
+        access, so errors decoding them are raised by that access rather than
+        by this method.
+        """
+        # raw_items() does not decode, so only the headers used here are
+        # decoded, each once, in a single scan of the header list
+        fetch_parse = msg.policy.header_fetch_parse
+        headers: Dict[str, List[Any]] = {}
+        for name, value in msg.raw_items():
+            key = name.lower()
+            if key in _HEADER_FIELDS:
+                headers.setdefault(key, []).append(fetch_parse(name, value))
 
         return cls(
-            message_id=msg["Message-ID"] or "",
-            subject=msg["Subject"] or "",
-            from_address=msg["From"] or "",
+            message_id=headers.get("message-id", [""])[0] or "",
+            subject=headers.get("subject", [""])[0] or "",
+            from_address=headers.get("from", [""])[0] or "",
             to_addresses=[
-                addr.strip() for addr in (msg["To"] or "").split(",") if addr
+                addr for _, addr in utils.getaddresses(headers.get("to", [])) if addr
             ],
             cc_addresses=[
-                addr.strip() for addr in (msg["Cc"] or "").split(",") if addr
+                addr for _, addr in utils.getaddresses(headers.get("cc", [])) if addr
             ],
-            body_text=body_text,
-            body_html=body_html,
-            timestamp=datetime.fromtimestamp(
-                utils.mktime_tz(cls._get_valid_date_tuple(msg["Date"]))
-            ),
-            references=[ref.strip() for ref in (msg["References"] or "").split()],
-            in_reply_to=msg["In-Reply-To"],
-            attachments=attachments,
+            references=" ".join(headers.get("references", [])).split(),
+            in_reply_to=headers.get("in-reply-to", [None])[0],
+            source=msg,
+        )
+
+    def _load_parts(self) -> None:
+        """Set the unset body and attachment fields from the source message."""
+        if self._source is None:
+            parts: Tuple[str, Optional[str], List[Mapping[str, Any]]] = ("", None, [])
+        else:
+            parts = EmailProcessor.process_message_parts(self._source)
+        body_text, body_html, attachments = parts
+        if isinstance(self._body_text, _Unset):
+            self._body_text = body_text
+        if isinstance(self._body_html, _Unset):
+            self._body_html = body_html
+        if isinstance(self._attachments, _Unset):
+            self._attachments = attachments
+        self._release_source()
+
+    def _load_timestamp(self) -> None:
+        """Set the timestamp from the source message if it is unset."""
+        if not isinstance(self._timestamp, _Unset):
+            return
+        if self._source is None:
+            self._timestamp = datetime.now()
+        else:
+            self._timestamp = datetime.fromtimestamp(
+                utils.mktime_tz(self._get_valid_date_tuple(self._source["Date"]))
+            )
+        self._release_source()
+
+    def _release_source(self) -> None:
+        """Drop the source message once no field is left to parse from it."""
+        if not any(
+            isinstance(value, _Unset)
+            for value in (
+                self._body_text,
+                self._body_html,
+                self._timestamp,
+                self._attachments,
+            )
+        ):
+            self._source = None
+
+    @property
+    def body_text(self) -> str:
+        """Plain text body of the message."""
+        if isinstance(self._body_text, _Unset):
+            self._load_parts()
+        return cast(str, self._body_text)
+
+    @body_text.setter
+    def body_text(self, value: str) -> None:
+        self._body_text = value
+        self._html_content = _UNSET
+
+    @property
+    def body_html(self) -> Optional[str]:
+        """HTML body of the message as received, if any."""
+        if isinstance(self._body_html, _Unset):
+            self._load_parts()
+        return cast(Optional[str], self._body_html)
+
+    @body_html.setter
+    def body_html(self, value: Optional[str]) -> None:
+        self._body_html = value
+        self._html_content = _UNSET
+
+    @property
+    def timestamp(self) -> datetime:
+        """Date the message was sent."""
+        if isinstance(self._timestamp, _Unset):
+            self._load_timestamp()
+        return cast(datetime, self._timestamp)
+
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        self._timestamp = value
+        self._timestamp_iso = _UNSET
+
+    @property
+    def attachments(self) -> List[Mapping[str, Any]]:
+        """Attachments of the message."""
+        if isinstance(self._attachments, _Unset):
+            self._load_parts()
+        return cast(List[Mapping[str, Any]], self._attachments)
+
+    @attachments.setter
+    def attachments(self, value: List[Mapping[str, Any]]) -> None:
+        self._attachments = value
+
+    def __eq__(self, other: object) -> bool:
+        """Compare every field, parsing the lazily loaded ones first."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in _COMPARED_FIELDS
         )
 
     @staticmethod
     def _get_valid_date_tuple(
         date_str: Optional[str],
-    ) -> Tuple[int, int, int, int, int, int, int, int, int, Optional[int]]:
+    ) -> DateTuple:
         """Get a valid date tuple from a date string, using current time as fallback."""
-        default_tuple = utils.parsedate_tz(utils.formatdate(localtime=True))
-        assert (
-            default_tuple is not None
-        )  # formatdate() always returns a valid date string
-
-        if date_str is None:
-            return default_tuple
+        if date_str is not None:
+            parsed = _parse_date_tuple(str(date_str))
+            if parsed is not None:
+                return parsed
 
-        parsed = utils.parsedate_tz(date_str)
-        return parsed if parsed is not None else default_tuple
+        return _current_date_tuple(int(time.time()))
 
     def create_reply(
         self, reply_text: str, include_history: bool = True, quote_level: int = 1
@@ -106,9 +349,11 @@ class EmailData:
             raise ValueError("Cannot create reply: original message has no recipients")
 
         # Build references list
-        new_references = list(self.references)  # Convert to list and copy
-        if self.message_id:
-            new_references.append(self.message_id)
+        new_references = (
+            [*self.references, self.message_id]
+            if self.message_id
+            else list(self.references)
+        )
 
         # Build reply body with proper formatting
         body_text = ReplyBuilder.build_reply_body(
@@ -124,9 +369,11 @@ class EmailData:
         # Create reply email data
         return EmailData(
             message_id="",  # Will be set by email server
-            subject=f"Re: {self.subject}"
-            if not self.subject.startswith("Re: ")
-            else self.subject,
+            subject=(
+                self.subject
+                if self.subject.startswith(_REPLY_PREFIX)
+                else _REPLY_PREFIX + self.subject
+            ),
             from_address=self.to_addresses[0],  # Use the first recipient as sender
             to_addresses=[self.from_address],
             cc_addresses=self.cc_addresses,
@@ -137,8 +384,24 @@ class EmailData:
             in_reply_to=self.message_id,
         )
 
+    @property
+    def timestamp_iso(self) -> Optional[str]:
+        """Timestamp in ISO 8601 format, formatted once per instance."""
+        if isinstance(self._timestamp_iso, _Unset):
+            timestamp = self.timestamp
+            self._timestamp_iso = timestamp.isoformat() if timestamp else None
+        return self._timestamp_iso
+
+    @property
+    def unread(self) -> Optional[bool]:
+        """Whether the email is unread, or None when labels are unknown."""
+        return None if self.labels is None else "UNREAD" in self.labels
+
     def to_email_message(self) -> EmailMessage:
-        """Convert EmailData to an EmailMessage object."""
+        """Convert EmailData to an EmailMessage object.
+
+        Every call builds a new message, so callers may modify the result.
+        """
         msg = EmailMessage()
         msg["Subject"] = self.subject
         msg["From"] = self.from_address
@@ -150,25 +413,26 @@ class EmailData:
         if self.references:
             msg["References"] = " ".join(self.references)
 
-        # Convert markdown to HTML if needed
-        html_content = self._get_html_content()
-
-        # Set message content
-        self._set_message_content(msg, html_content)
+        # Set message content, converting markdown to HTML if needed
+        self._set_message_content(msg, self.html_content)
 
         return msg
 
-    def _get_html_content(self) -> Optional[str]:
+    @property
+    def html_content(self) -> Optional[str]:
+        """HTML body of the message, converted from markdown if needed."""
+        if isinstance(self._html_content, _Unset):
+            self._html_content = self._render_html()
+        return self._html_content
+
+    def _render_html(self) -> Optional[str]:
         """Get HTML content, converting from markdown if needed."""
         if self.body_html:
             return self.body_html
 
         # Convert markdown to HTML if text appears to be markdown
-        if any(
-            marker in self.body_text for marker in ["```", "#", "**", "__", ">", "-"]
-        ):
-            converter = MarkdownConverter()
-            return converter.convert(self.body_text)
+        if _MARKDOWN_MARKER.search(self.body_text):
+            return _markdown_to_html(self.body_text)
 
         return None
 
@@ -176,32 +440,32 @@ class EmailData:
         self, msg: EmailMessage, html_content: Optional[str]
     ) -> None:
         """Set the message content including attachments."""
-        if self.attachments:
-            msg.make_mixed()
-            content = EmailMessage()
+        attachments = self.attachments
 
-            if html_content:
-                content.make_alternative()
-                content.add_alternative(self.body_text, subtype="plain")
-                content.add_alternative(html_content, subtype="html")
-            else:
-                content.set_content(self.body_text)
+        # With attachments the body goes into its own part of a mixed message
+        content = EmailMessage() if attachments else msg
+        if html_content:
+            content.make_alternative()
+            content.add_alternative(self.body_text, subtype="plain")
+            content.add_alternative(html_content, subtype="html")
+        else:
+            content.set_content(self.body_text)
 
+        if attachments:
+            msg.make_mixed()
             msg.attach(content)
 
-            # Add attachments
-            for attachment in self.attachments:
+            for attachment in attachments:
+                maintype, _, subtype = attachment["content_type"].partition("/")
+                payload = attachment["payload"]
+                if hasattr(payload, "read"):
+                    # File-like payloads, e.g. spooled to disk, are read at
+                    # send time
+                    payload.seek(0)
+                    payload = payload.read()
                 msg.add_attachment(
-                    attachment["payload"],
-                    maintype=attachment["content_type"].split("/")[0],
-                    subtype=attachment["content_type"].split("/")[1],
+                    payload,
+                    maintype=maintype,
+                    subtype=subtype,
                     filename=attachment["filename"],
                 )
-        else:
-            # No attachments
-            if html_content:
-                msg.make_alternative()
-                msg.add_alternative(self.body_text, subtype="plain")
-                msg.add_alternative(html_content, subtype="html")
-            else:
-                msg.set_content(self.body_text)
@@ -1,6 +1,27 @@
 """Text processing utilities for email content."""
 
-from typing import List
+import re
+from typing import Iterable, Iterator, List
+
+# Start of a quoted line; quote markers may be indented by spaces or tabs
+_QUOTE_LINE = re.compile(r"^[ \t]*>", re.MULTILINE)
+# Run of consecutive quoted lines, including their line breaks
+_QUOTE_BLOCK = re.compile(r"(?:^[ \t]*>[^\n]*(?:\n|$))+", re.MULTILINE)
+
+
+def _quote_blocks(content: str) -> Iterator["re.Match[str]"]:
+    """Yield the quote blocks of a text in order.
+
+    ``_QUOTE_LINE`` finds where each block starts and ``_QUOTE_BLOCK`` then
+    matches its extent. Both patterns are anchored to line starts and only
+    use linear quantifiers, so neither can backtrack catastrophically.
+    """
+    start = _QUOTE_LINE.search(content)
+    while start is not None:
+        match = _QUOTE_BLOCK.match(content, start.start())
+        assert match is not None  # start is always at a quoted line
+        yield match
+        start = _QUOTE_LINE.search(content, match.end())
 
 
 class TextProcessor:
@@ -16,39 +37,40 @@ class TextProcessor:
         Returns:
             Processed text with preserved quote formatting
         """
-        lines = content.split("\n")
+        # Without a quote marker the whole text is the only part
+        if ">" not in content:
+            return content if content.strip() else ""
+
         parts: List[str] = []
-        current_text: List[str] = []
-        current_quote: List[str] = []
-
-        for line in lines:
-            if line.startswith(">"):
-                if current_text:
-                    parts.append("\n".join(current_text))
-                    current_text = []
-                current_quote.append(line)
-            else:
-                if current_quote:
-                    parts.append("\n".join(current_quote))
-                    current_quote = []
-                current_text.append(line)
-
-        # Add any remaining content
-        if current_text:
-            parts.append("\n".join(current_text))
-        if current_quote:
-            parts.append("\n".join(current_quote))
-
-        return "\n".join(part for part in parts if part.strip())
+        last_end = 0
+
+        # Quote blocks and the text between them are the parts of the body;
+        # the newline separating two parts belongs to neither of them
+        for match in _quote_blocks(content):
+            start = match.start()
+            if start > last_end:
+                text = content[last_end : start - 1]
+                if text.strip():
+                    parts.append(text)
+            # Quote blocks always contain ">" and are never blank
+            quote = match.group()
+            parts.append(quote[:-1] if quote.endswith("\n") else quote)
+            last_end = match.end()
+        text = content[last_end:]
+        if text.strip():
+            parts.append(text)
+
+        return "\n".join(parts)
 
     @classmethod
-    def combine_text_parts(cls, parts: List[str]) -> str:
+    def combine_text_parts(cls, parts: Iterable[str]) -> str:
         """Combine multiple text parts while preserving structure.
 
         Args:
-            parts: List of text parts to combine
+            parts: Text parts to combine
 
         Returns:
             Combined text with proper spacing and structure
         """
-        return "\n".join(part for part in parts if part.strip())
+        # A list lets str.join size the result up front
+        return "\n".join([part for part in parts if part.strip()])
@@ -1,16 +1,29 @@
 """Tool definitions for AI model integration."""
 
-from pymailai.tools.core import execute_query_emails, execute_send_email
+from pymailai.tools.core import (
+    execute_query_emails,
+    execute_send_email,
+    iter_query_emails,
+)
 from pymailai.tools.schemas import (
+    get_email_tool_schema,
     get_email_tool_schema_anthropic,
+    get_email_tool_schema_anthropic_json,
     get_email_tool_schema_ollama,
+    get_email_tool_schema_ollama_json,
     get_email_tool_schema_openai,
+    get_email_tool_schema_openai_json,
 )
 
 __all__ = [
     "execute_query_emails",
     "execute_send_email",
+    "get_email_tool_schema",
     "get_email_tool_schema_anthropic",
+    "get_email_tool_schema_anthropic_json",
     "get_email_tool_schema_ollama",
+    "get_email_tool_schema_ollama_json",
     "get_email_tool_schema_openai",
+    "get_email_tool_schema_openai_json",
+    "iter_query_emails",
 ]
@@ -1,10 +1,106 @@
 """Core email tool implementations."""
 
-from typing import Dict, List, Optional, Union
+from typing import (
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    TypedDict,
+    Union,
+)
 
 from pymailai.base_client import BaseEmailClient
 from pymailai.message import EmailData
 
+# Functional syntax as "from" is a keyword
+QueryEmailResult = TypedDict(
+    "QueryEmailResult",
+    {
+        "id": str,
+        "subject": str,
+        "from": str,
+        "to": List[str],
+        "cc": List[str],
+        "date": Optional[str],
+        "body": Optional[str],
+        "unread": Optional[bool],
+    },
+)
+
+
+class _QueryEmailErrorBase(TypedDict):
+    error: str
+
+
+class QueryEmailError(_QueryEmailErrorBase, total=False):
+    """Entry reported in place of messages that could not be queried."""
+
+    id: str
+
+
+QueryEmailEntry = Union[QueryEmailResult, QueryEmailError]
+
+
+def _email_to_dict(
+    email: EmailData, include_body: Optional[bool]
+) -> QueryEmailResult:
+    """Convert a queried email into the query_emails result format."""
+    return {
+        "id": email.message_id,
+        "subject": email.subject,
+        "from": email.from_address,
+        "to": email.to_addresses,
+        "cc": email.cc_addresses,
+        "date": email.timestamp_iso,
+        "body": email.body_text if include_body else None,
+        "unread": email.unread,
+    }
+
+
+async def iter_query_emails(
+    client: BaseEmailClient,
+    after_date: Optional[str] = None,
+    before_date: Optional[str] = None,
+    subject: Optional[str] = None,
+    from_address: Optional[str] = None,
+    to_address: Optional[str] = None,
+    label: Optional[str] = None,
+    unread_only: Optional[bool] = None,
+    include_body: Optional[bool] = None,
+) -> AsyncIterator[QueryEmailEntry]:
+    """Run the query_emails tool, yielding each message as it is received.
+
+    Takes the same arguments as ``execute_query_emails``. Errors are yielded
+    as ``{"error": ...}`` entries after the messages received before them.
+    """
+    # Only the filters that were given, without building a dict of Nones
+    query_params = {
+        k: v
+        for k, v in (
+            ("after_date", after_date),
+            ("before_date", before_date),
+            ("subject", subject),
+            ("from_address", from_address),
+            ("to_address", to_address),
+            ("label", label),
+            ("unread_only", unread_only),
+            ("include_body", include_body),
+        )
+        if v is not None
+    }
+
+    try:
+        async for email in client.query_messages(query_params):
+            result: QueryEmailEntry
+            try:
+                result = _email_to_dict(email, include_body)
+            except Exception as e:
+                result = {"error": str(e), "id": email.message_id}
+            yield result
+    except Exception as e:
+        error: QueryEmailError = {"error": str(e)}
+        yield error
+
 
 async def execute_query_emails(
     client: BaseEmailClient,
@@ -16,7 +112,7 @@ async def execute_query_emails(
     label: Optional[str] = None,
     unread_only: Optional[bool] = None,
     include_body: Optional[bool] = None,
-) -> List[Dict]:
+) -> List[QueryEmailEntry]:
     """Execute the query_emails tool using the provided email client.
 
     Args:
@@ -31,44 +127,23 @@ async def execute_query_emails(
         include_body: Optional flag to include message body content
 
     Returns:
-        List of matching messages as dictionaries
+        List of matching messages as dictionaries; see ``iter_query_emails``
+        to consume them as they arrive
     """
-    try:
-        query_params = {
-            "after_date": after_date,
-            "before_date": before_date,
-            "subject": subject,
-            "from_address": from_address,
-            "to_address": to_address,
-            "label": label,
-            "unread_only": unread_only,
-            "include_body": include_body,
-        }
-
-        # Remove None values
-        query_params = {k: v for k, v in query_params.items() if v is not None}
-
-        messages = []
-        async for email in client.query_messages(query_params):
-            messages.append(
-                {
-                    "id": email.message_id,
-                    "subject": email.subject,
-                    "from": email.from_address,
-                    "to": email.to_addresses,
-                    "cc": email.cc_addresses,
-                    "date": email.timestamp.isoformat() if email.timestamp else None,
-                    "body": email.body_text if include_body else None,
-                    "unread": "UNREAD" in email.labels
-                    if hasattr(email, "labels")
-                    else None,
-                }
-            )
-
-        return messages
-
-    except Exception as e:
-        return [{"error": str(e)}]
+    return [
+        message
+        async for message in iter_query_emails(
+            client,
+            after_date=after_date,
+            before_date=before_date,
+            subject=subject,
+            from_address=from_address,
+            to_address=to_address,
+            label=label,
+            unread_only=unread_only,
+            include_body=include_body,
+        )
+    ]
 
 
 async def execute_send_email(
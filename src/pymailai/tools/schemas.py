@@ -1,240 +1,206 @@
-"""Email tool schemas for different AI model integrations."""
+"""Email tool schemas for different AI model integrations.
 
-from typing import Dict, List
+The schemas never change, so they are built once at import time and the
+same read-only objects are returned on every call.
+"""
 
+import json
+from typing import Any, Dict, Literal, Mapping, NoReturn, Sequence
 
-def get_email_tool_schema_anthropic() -> List[Dict]:
-    """Get the email tool schema for Anthropic Claude models."""
-    return [
-        {
-            "name": "send_email",
-            "description": "Send an email message to specified recipients",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "to": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of email addresses to send to",
-                    },
-                    "subject": {
-                        "type": "string",
-                        "description": "Email subject line",
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Email body content (can include markdown formatting)",
-                    },
-                    "cc": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Optional list of CC recipients",
-                    },
-                },
-                "required": ["to", "subject", "body"],
+
+class _FrozenDict(Dict[str, Any]):
+    """Dict that refuses modification.
+
+    Unlike ``MappingProxyType`` it is still a ``dict``, so the schemas can be
+    passed to ``json.dumps`` and the model SDKs unchanged.
+    """
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("email tool schemas are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> Any:
+        return type(self), (dict(self),)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only dicts and lists to tuples."""
+    if isinstance(value, _FrozenDict):
+        # Already frozen, and possibly shared with another schema
+        return value
+    if isinstance(value, dict):
+        return _FrozenDict((k, _freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Item schema of the recipient lists
+_STRING_ITEMS: Mapping[str, Any] = _freeze({"type": "string"})
+
+_SEND_EMAIL_PARAMETERS: Mapping[str, Any] = _freeze(
+    {
+        "type": "object",
+        "properties": {
+            "to": {
+                "type": "array",
+                "items": _STRING_ITEMS,
+                "description": "List of email addresses to send to",
             },
-        },
-        {
-            "name": "query_emails",
-            "description": "Search and retrieve emails based on specified criteria",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "after_date": {
-                        "type": "string",
-                        "description": "Return emails after this date (YYYY-MM-DD)",
-                    },
-                    "before_date": {
-                        "type": "string",
-                        "description": "Return emails before this date (YYYY-MM-DD)",
-                    },
-                    "subject": {
-                        "type": "string",
-                        "description": "Search for emails with this text in subject",
-                    },
-                    "from_address": {
-                        "type": "string",
-                        "description": "Search for emails from this address",
-                    },
-                    "to_address": {
-                        "type": "string",
-                        "description": "Search for emails to this address",
-                    },
-                    "label": {
-                        "type": "string",
-                        "description": "Search for emails with this Gmail label",
-                    },
-                    "unread_only": {
-                        "type": "boolean",
-                        "description": "Only return unread emails if true",
-                    },
-                    "include_body": {
-                        "type": "boolean",
-                        "description": "Include email body content in results",
-                    },
-                },
+            "subject": {
+                "type": "string",
+                "description": "Email subject line",
+            },
+            "body": {
+                "type": "string",
+                "description": "Email body content (can include markdown formatting)",
+            },
+            "cc": {
+                "type": "array",
+                "items": _STRING_ITEMS,
+                "description": "Optional list of CC recipients",
             },
         },
-    ]
+        "required": ["to", "subject", "body"],
+    }
+)
 
-
-def get_email_tool_schema_openai() -> List[Dict]:
-    """Get the email tool schema for OpenAI models."""
-    return [
-        {
-            "type": "function",
-            "function": {
-                "name": "send_email",
-                "description": "Send an email message to specified recipients",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "to": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of email addresses to send to",
-                        },
-                        "subject": {
-                            "type": "string",
-                            "description": "Email subject line",
-                        },
-                        "body": {
-                            "type": "string",
-                            "description": "Email body content (can include markdown formatting)",
-                        },
-                        "cc": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Optional list of CC recipients",
-                        },
-                    },
-                    "required": ["to", "subject", "body"],
-                },
+_QUERY_EMAILS_PARAMETERS: Mapping[str, Any] = _freeze(
+    {
+        "type": "object",
+        "properties": {
+            "after_date": {
+                "type": "string",
+                "description": "Return emails after this date (YYYY-MM-DD)",
             },
-        },
-        {
-            "type": "function",
-            "function": {
-                "name": "query_emails",
-                "description": "Search and retrieve emails based on specified criteria",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "after_date": {
-                            "type": "string",
-                            "description": "Return emails after this date (YYYY-MM-DD)",
-                        },
-                        "before_date": {
-                            "type": "string",
-                            "description": "Return emails before this date (YYYY-MM-DD)",
-                        },
-                        "subject": {
-                            "type": "string",
-                            "description": "Search for emails with this text in subject",
-                        },
-                        "from_address": {
-                            "type": "string",
-                            "description": "Search for emails from this address",
-                        },
-                        "to_address": {
-                            "type": "string",
-                            "description": "Search for emails to this address",
-                        },
-                        "label": {
-                            "type": "string",
-                            "description": "Search for emails with this Gmail label",
-                        },
-                        "unread_only": {
-                            "type": "boolean",
-                            "description": "Only return unread emails if true",
-                        },
-                        "include_body": {
-                            "type": "boolean",
-                            "description": "Include email body content in results",
-                        },
-                    },
-                },
+            "before_date": {
+                "type": "string",
+                "description": "Return emails before this date (YYYY-MM-DD)",
+            },
+            "subject": {
+                "type": "string",
+                "description": "Search for emails with this text in subject",
+            },
+            "from_address": {
+                "type": "string",
+                "description": "Search for emails from this address",
+            },
+            "to_address": {
+                "type": "string",
+                "description": "Search for emails to this address",
+            },
+            "label": {
+                "type": "string",
+                "description": "Search for emails with this Gmail label",
+            },
+            "unread_only": {
+                "type": "boolean",
+                "description": "Only return unread emails if true",
+            },
+            "include_body": {
+                "type": "boolean",
+                "description": "Include email body content in results",
             },
         },
-    ]
+    }
+)
 
+# Name, description and parameters of each tool, wrapped below in the
+# envelope each provider expects
+_TOOLS = (
+    (
+        "send_email",
+        "Send an email message to specified recipients",
+        _SEND_EMAIL_PARAMETERS,
+    ),
+    (
+        "query_emails",
+        "Search and retrieve emails based on specified criteria",
+        _QUERY_EMAILS_PARAMETERS,
+    ),
+)
 
-def get_email_tool_schema_ollama() -> List[Dict]:
-    """Get the email tool schema for Ollama models."""
-    return [
-        {
-            "type": "function",
-            "function": {
-                "name": "send_email",
-                "description": "Send an email message to specified recipients",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "to": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "List of email addresses to send to",
-                        },
-                        "subject": {
-                            "type": "string",
-                            "description": "Email subject line",
-                        },
-                        "body": {
-                            "type": "string",
-                            "description": "Email body content (can include markdown formatting)",
-                        },
-                        "cc": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Optional list of CC recipients",
-                        },
-                    },
-                    "required": ["to", "subject", "body"],
-                },
-            },
-        },
+_ANTHROPIC_SCHEMA: Sequence[Mapping[str, Any]] = _freeze(
+    [
+        {"name": name, "description": description, "input_schema": parameters}
+        for name, description, parameters in _TOOLS
+    ]
+)
+
+# OpenAI and Ollama share the function-calling tool format
+_FUNCTION_SCHEMA: Sequence[Mapping[str, Any]] = _freeze(
+    [
         {
             "type": "function",
             "function": {
-                "name": "query_emails",
-                "description": "Search and retrieve emails based on specified criteria",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "after_date": {
-                            "type": "string",
-                            "description": "Return emails after this date (YYYY-MM-DD)",
-                        },
-                        "before_date": {
-                            "type": "string",
-                            "description": "Return emails before this date (YYYY-MM-DD)",
-                        },
-                        "subject": {
-                            "type": "string",
-                            "description": "Search for emails with this text in subject",
-                        },
-                        "from_address": {
-                            "type": "string",
-                            "description": "Search for emails from this address",
-                        },
-                        "to_address": {
-                            "type": "string",
-                            "description": "Search for emails to this address",
-                        },
-                        "label": {
-                            "type": "string",
-                            "description": "Search for emails with this Gmail label",
-                        },
-                        "unread_only": {
-                            "type": "boolean",
-                            "description": "Only return unread emails if true",
-                        },
-                        "include_body": {
-                            "type": "boolean",
-                            "description": "Include email body content in results",
-                        },
-                    },
-                },
+                "name": name,
+                "description": description,
+                "parameters": parameters,
             },
-        },
+        }
+        for name, description, parameters in _TOOLS
     ]
+)
+
+# Compact JSON encodings, for callers that write the schemas into request
+# bodies themselves
+_ANTHROPIC_SCHEMA_JSON = json.dumps(_ANTHROPIC_SCHEMA, separators=(",", ":")).encode()
+_FUNCTION_SCHEMA_JSON = json.dumps(_FUNCTION_SCHEMA, separators=(",", ":")).encode()
+
+Provider = Literal["anthropic", "openai", "ollama"]
+
+_SCHEMAS: Dict[str, Sequence[Mapping[str, Any]]] = {
+    "anthropic": _ANTHROPIC_SCHEMA,
+    "openai": _FUNCTION_SCHEMA,
+    "ollama": _FUNCTION_SCHEMA,
+}
+
+
+def get_email_tool_schema(provider: Provider) -> Sequence[Mapping[str, Any]]:
+    """Get the email tool schema for the given model provider.
+
+    Args:
+        provider: One of "anthropic", "openai" or "ollama"
+
+    Returns:
+        The provider's email tool schema
+
+    Raises:
+        ValueError: If the provider is not supported
+    """
+    try:
+        return _SCHEMAS[provider]
+    except KeyError:
+        raise ValueError(f"Unsupported provider: {provider}") from None
+
+
+def get_email_tool_schema_anthropic() -> Sequence[Mapping[str, Any]]:
+    """Get the email tool schema for Anthropic Claude models."""
+    return _ANTHROPIC_SCHEMA
+
+
+def get_email_tool_schema_openai() -> Sequence[Mapping[str, Any]]:
+    """Get the email tool schema for OpenAI models."""
+    return _FUNCTION_SCHEMA
+
+
+def get_email_tool_schema_ollama() -> Sequence[Mapping[str, Any]]:
+    """Get the email tool schema for Ollama models."""
+    return _FUNCTION_SCHEMA
+
+
+def get_email_tool_schema_anthropic_json() -> bytes:
+    """Get the Anthropic email tool schema encoded as JSON."""
+    return _ANTHROPIC_SCHEMA_JSON
+
+
+def get_email_tool_schema_openai_json() -> bytes:
+    """Get the OpenAI email tool schema encoded as JSON."""
+    return _FUNCTION_SCHEMA_JSON
+
+
+def get_email_tool_schema_ollama_json() -> bytes:
+    """Get the Ollama email tool schema encoded as JSON."""
+    return _FUNCTION_SCHEMA_JSON
@@ -0,0 +1,49 @@
+"""Fixtures shared by the test modules."""
+
+import copy
+
+import pytest
+
+from pymailai.config import EmailConfig
+from pymailai.message import EmailData
+
+
+@pytest.fixture(scope="session")
+def shared_email_config():
+    """Create the test email configuration once per session."""
+    return EmailConfig(
+        email="test@example.com",
+        password="password",
+        imap_server="imap.example.com",
+        smtp_server="smtp.example.com",
+        folder="INBOX",
+        check_interval=60,
+    )
+
+
+@pytest.fixture
+def email_config(shared_email_config):
+    """Create a test email configuration that tests may modify."""
+    return copy.copy(shared_email_config)
+
+
+@pytest.fixture(scope="session")
+def shared_test_message():
+    """Create the test email message once per session."""
+    return EmailData(
+        message_id="<test123@example.com>",
+        subject="Test Subject",
+        from_address="sender@example.com",
+        to_addresses=["recipient@example.com"],
+        cc_addresses=[],
+        body_text="Test message",
+        body_html=None,
+        timestamp=None,
+    )
+
+
+@pytest.fixture
+def test_message(shared_test_message):
+    """Create a test email message that tests may modify."""
+    # A deep copy also covers list fields mutated in place
+    return copy.deepcopy(shared_test_message)
@@ -3,57 +3,26 @@
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
 from pymailai.agent import EmailAgent
-from pymailai.config import EmailConfig
 from pymailai.message import EmailData
 
 
-@pytest.fixture
-def email_config():
-    """Create a test email configuration."""
-    return EmailConfig(
-        email="test@example.com",
-        password="password",
-        imap_server="imap.example.com",
-        smtp_server="smtp.example.com",
-        folder="INBOX",
-        check_interval=60,
-    )
-
-
-@pytest.fixture
-def test_message():
-    """Create a test email message."""
-    return EmailData(
-        message_id="<test123@example.com>",
-        subject="Test Subject",
-        from_address="sender@example.com",
-        to_addresses=["recipient@example.com"],
-        cc_addresses=[],
-        body_text="Test message",
-        body_html=None,
-        timestamp=None,
-    )
-
-
 class AsyncIteratorMock:
     """Helper class to create async iterators for testing."""
     def __init__(self, items):
-        self.items = items.copy()
+        # Iterating leaves the caller's items in place without copying them
+        self.items = iter(items)
 
     def __aiter__(self):
         return self
 
     async def __anext__(self):
         try:
-            return self.items.pop(0)
-        except IndexError:
+            return next(self.items)
+        except StopIteration:
             raise StopAsyncIteration
 
 
-@pytest.mark.asyncio
 async def test_agent_initialization(email_config):
     """Test EmailAgent initialization."""
     handler = AsyncMock()
@@ -66,7 +35,6 @@ async def test_agent_initialization(email_config):
     assert agent._task is None
 
 
-@pytest.mark.asyncio
 async def test_process_message_with_handler(email_config, test_message):
     """Test message processing with a custom handler."""
     expected_response = EmailData(
@@ -89,7 +57,6 @@ async def test_process_message_with_handler(email_config, test_message):
     assert response == expected_response
 
 
-@pytest.mark.asyncio
 async def test_process_message_without_handler(email_config, test_message):
     """Test message processing without a handler."""
     agent = EmailAgent(email_config)
@@ -97,7 +64,6 @@ async def test_process_message_without_handler(email_config, test_message):
     assert response is None
 
 
-@pytest.mark.asyncio
 async def test_agent_start_stop(email_config):
     """Test starting and stopping the email agent."""
     agent = EmailAgent(email_config)
@@ -122,7 +88,6 @@ async def test_agent_start_stop(email_config):
         assert agent._task is None
 
 
-@pytest.mark.asyncio
 async def test_check_messages(email_config, test_message):
     """Test checking for new messages."""
     handler = AsyncMock(return_value=test_message)
@@ -147,7 +112,6 @@ async def test_check_messages(email_config, test_message):
     mock_client.send_message.assert_called_once_with(test_message)
 
 
-@pytest.mark.asyncio
 async def test_agent_context_manager(email_config):
     """Test async context manager functionality."""
     agent = EmailAgent(email_config)
@@ -169,7 +133,6 @@ async def test_agent_context_manager(email_config):
         assert agent._task is None
 
 
-@pytest.mark.asyncio
 async def test_check_messages_error_handling(email_config):
     """Test error handling during message checking."""
     agent = EmailAgent(email_config)
@@ -191,7 +154,6 @@ async def test_check_messages_error_handling(email_config):
     await agent._check_messages()
 
 
-@pytest.mark.asyncio
 async def test_message_processing_error_handling(email_config, test_message):
     """Test error handling during message processing."""
     handler = AsyncMock(side_effect=Exception("Processing error"))
@@ -6,39 +6,9 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from pymailai.client import EmailClient
-from pymailai.config import EmailConfig
 from pymailai.message import EmailData
 
 
-@pytest.fixture
-def email_config():
-    """Create a test email configuration."""
-    return EmailConfig(
-        email="test@example.com",
-        password="password",
-        imap_server="imap.example.com",
-        smtp_server="smtp.example.com",
-        folder="INBOX",
-        check_interval=60,
-    )
-
-
-@pytest.fixture
-def test_message():
-    """Create a test email message."""
-    return EmailData(
-        message_id="<test123@example.com>",
-        subject="Test Subject",
-        from_address="sender@example.com",
-        to_addresses=["recipient@example.com"],
-        cc_addresses=[],
-        body_text="Test message",
-        body_html=None,
-        timestamp=None,
-    )
-
-
-@pytest.mark.asyncio
 async def test_client_initialization(email_config):
     """Test EmailClient initialization."""
     client = EmailClient(email_config)
@@ -47,7 +17,6 @@ async def test_client_initialization(email_config):
     assert client._smtp is None
 
 
-@pytest.mark.asyncio
 async def test_connect_imap_smtp(email_config):
     """Test connecting to IMAP and SMTP servers."""
     client = EmailClient(email_config)
@@ -79,7 +48,6 @@ async def test_connect_imap_smtp(email_config):
         mock_smtp.login.assert_called_once_with(email_config.email, email_config.password)
 
 
-@pytest.mark.asyncio
 async def test_connect_smtp_ssl(email_config):
     """Test connecting to SMTP with SSL (port 465)."""
     email_config.smtp_port = 465
@@ -97,7 +65,6 @@ async def test_connect_smtp_ssl(email_config):
         assert not mock_smtp.starttls.called
 
 
-@pytest.mark.asyncio
 async def test_disconnect(email_config):
     """Test disconnecting from email servers."""
     client = EmailClient(email_config)
@@ -117,7 +84,6 @@ async def test_disconnect(email_config):
     assert client._smtp is None
 
 
-@pytest.mark.asyncio
 async def test_fetch_new_messages(email_config):
     """Test fetching new messages."""
     client = EmailClient(email_config)
@@ -142,7 +108,6 @@ async def test_fetch_new_messages(email_config):
     client._imap.search.assert_called_once_with('UNSEEN')
 
 
-@pytest.mark.asyncio
 async def test_send_message(email_config, test_message):
     """Test sending a message."""
     client = EmailClient(email_config)
@@ -153,7 +118,6 @@ async def test_send_message(email_config, test_message):
     client._smtp.send_message.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_mark_as_read(email_config):
     """Test marking a message as read."""
     client = EmailClient(email_config)
@@ -168,7 +132,6 @@ async def test_mark_as_read(email_config):
     client._imap.store.assert_called_once_with('1', '+FLAGS', '\\Seen')
 
 
-@pytest.mark.asyncio
 async def test_context_manager(email_config):
     """Test async context manager functionality."""
     client = EmailClient(email_config)
@@ -184,7 +147,6 @@ async def test_context_manager(email_config):
     mock_disconnect.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_fetch_messages_error_handling(email_config):
     """Test error handling during message fetching."""
     client = EmailClient(email_config)
@@ -201,7 +163,6 @@ async def test_fetch_messages_error_handling(email_config):
     assert len(messages) == 0
 
 
-@pytest.mark.asyncio
 async def test_mark_as_read_error_handling(email_config):
     """Test error handling when marking messages as read."""
     client = EmailClient(email_config)
@@ -215,7 +176,6 @@ async def test_mark_as_read_error_handling(email_config):
     await client.mark_as_read("<test123@example.com>")
 
 
-@pytest.mark.asyncio
 async def test_smtp_starttls_error_handling(email_config):
     """Test SMTP STARTTLS error handling."""
     client = EmailClient(email_config)
@@ -1,43 +1,23 @@
 """Comprehensive tests for EmailClient class."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 import pytest
 
 from pymailai.client import EmailClient
-from pymailai.config import EmailConfig
 from pymailai.message import EmailData
 
 
-@pytest.fixture
-def email_config():
-    """Create a test email configuration."""
-    return EmailConfig(
-        email="test@example.com",
-        password="password",
-        imap_server="imap.example.com",
-        smtp_server="smtp.example.com",
-        folder="INBOX",
-        check_interval=60,
-    )
-
-
-@pytest.fixture
-def test_message():
-    """Create a test email message."""
-    return EmailData(
-        message_id="<test123@example.com>",
-        subject="Test Subject",
-        from_address="sender@example.com",
-        to_addresses=["recipient@example.com"],
-        cc_addresses=[],
-        body_text="Test message",
-        body_html=None,
-        timestamp=None,
-    )
-
-
-@pytest.mark.asyncio
+@pytest.fixture(autouse=True)
+def mock_servers(monkeypatch):
+    """Replace the IMAP and SMTP connection classes for every test."""
+    mock_imap = AsyncMock()
+    mock_smtp = AsyncMock()
+    monkeypatch.setattr("aioimaplib.IMAP4_SSL", lambda *args, **kwargs: mock_imap)
+    monkeypatch.setattr("aiosmtplib.SMTP", lambda *args, **kwargs: mock_smtp)
+    return mock_imap, mock_smtp
+
+
 async def test_client_initialization(email_config):
     """Test EmailClient initialization."""
     client = EmailClient(email_config)
@@ -46,77 +26,50 @@ async def test_client_initialization(email_config):
     assert client._smtp is None
 
 
-@pytest.mark.asyncio
-async def test_connect_imap_smtp(email_config):
+async def test_connect_imap_smtp(email_config, mock_servers):
     """Test connecting to IMAP and SMTP servers."""
+    mock_imap, mock_smtp = mock_servers
     client = EmailClient(email_config)
 
-    # Mock IMAP
-    mock_imap = AsyncMock()
-    mock_imap.wait_hello_from_server = AsyncMock()
-    mock_imap.login = AsyncMock()
-    mock_imap.select = AsyncMock()
-
-    # Mock SMTP
-    mock_smtp = AsyncMock()
-    mock_smtp.connect = AsyncMock()
-    mock_smtp.starttls = AsyncMock()
-    mock_smtp.login = AsyncMock()
+    await client.connect()
 
-    with patch('aioimaplib.IMAP4_SSL', return_value=mock_imap), \
-            patch('aiosmtplib.SMTP', return_value=mock_smtp):
-        await client.connect()
+    # Verify IMAP connection
+    mock_imap.wait_hello_from_server.assert_called_once()
+    mock_imap.login.assert_called_once_with(email_config.email, email_config.password)
+    mock_imap.select.assert_called_once_with(email_config.folder)
 
-        # Verify IMAP connection
-        mock_imap.wait_hello_from_server.assert_called_once()
-        mock_imap.login.assert_called_once_with(email_config.email, email_config.password)
-        mock_imap.select.assert_called_once_with(email_config.folder)
+    # Verify SMTP connection
+    mock_smtp.connect.assert_called_once()
+    mock_smtp.starttls.assert_called_once()
+    mock_smtp.login.assert_called_once_with(email_config.email, email_config.password)
 
-        # Verify SMTP connection
-        mock_smtp.connect.assert_called_once()
-        mock_smtp.starttls.assert_called_once()
-        mock_smtp.login.assert_called_once_with(email_config.email, email_config.password)
 
-
-@pytest.mark.asyncio
-async def test_connect_smtp_ssl(email_config):
+async def test_connect_smtp_ssl(email_config, mock_servers):
     """Test connecting to SMTP with SSL (port 465)."""
+    _, mock_smtp = mock_servers
     email_config.smtp_port = 465
     client = EmailClient(email_config)
 
-    mock_smtp = AsyncMock()
-    mock_smtp.connect = AsyncMock()
-    mock_smtp.login = AsyncMock()
-
-    with patch('aioimaplib.IMAP4_SSL', return_value=AsyncMock()), \
-            patch('aiosmtplib.SMTP', return_value=mock_smtp):
-        await client.connect()
+    await client.connect()
 
-        # Verify SSL was used
-        assert not mock_smtp.starttls.called
+    # Verify SSL was used
+    assert not mock_smtp.starttls.called
 
 
-@pytest.mark.asyncio
-async def test_connect_smtp_no_tls(email_config):
+async def test_connect_smtp_no_tls(email_config, mock_servers):
     """Test connecting to SMTP without TLS."""
+    _, mock_smtp = mock_servers
     # Use port 25 since port 587 always requires TLS
     email_config.smtp_port = 25
     email_config.tls = False
     client = EmailClient(email_config)
 
-    mock_smtp = AsyncMock()
-    mock_smtp.connect = AsyncMock()
-    mock_smtp.login = AsyncMock()
-
-    with patch('aioimaplib.IMAP4_SSL', return_value=AsyncMock()), \
-            patch('aiosmtplib.SMTP', return_value=mock_smtp):
-        await client.connect()
+    await client.connect()
 
-        # Verify TLS was not used with port 25
-        assert not mock_smtp.starttls.called
+    # Verify TLS was not used with port 25
+    assert not mock_smtp.starttls.called
 
 
-@pytest.mark.asyncio
 async def test_fetch_new_messages_simple_format(email_config):
     """Test fetching new messages with simple IMAP response format."""
     client = EmailClient(email_config)
@@ -143,7 +96,6 @@ async def test_fetch_new_messages_simple_format(email_config):
 
 
 
-@pytest.mark.asyncio
 async def test_fetch_messages_with_attachments(email_config):
     """Test fetching messages with attachments."""
     client = EmailClient(email_config)
@@ -186,7 +138,6 @@ async def test_fetch_messages_with_attachments(email_config):
     assert attachment["content_type"] == "text/plain"
 
 
-@pytest.mark.asyncio
 async def test_fetch_messages_error_handling(email_config):
     """Test error handling during message fetching."""
     client = EmailClient(email_config)
@@ -203,7 +154,6 @@ async def test_fetch_messages_error_handling(email_config):
     assert len(messages) == 0
 
 
-@pytest.mark.asyncio
 async def test_mark_as_read(email_config):
     """Test marking a message as read."""
     client = EmailClient(email_config)
@@ -218,7 +168,6 @@ async def test_mark_as_read(email_config):
     client._imap.store.assert_called_once_with('1', '+FLAGS', '\\Seen')
 
 
-@pytest.mark.asyncio
 async def test_mark_as_read_error_handling(email_config):
     """Test error handling when marking messages as read."""
     client = EmailClient(email_config)
@@ -232,7 +181,6 @@ async def test_mark_as_read_error_handling(email_config):
     await client.mark_as_read("<test123@example.com>")
 
 
-@pytest.mark.asyncio
 async def test_send_message(email_config, test_message):
     """Test sending a message."""
     client = EmailClient(email_config)
@@ -243,7 +191,6 @@ async def test_send_message(email_config, test_message):
     client._smtp.send_message.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_disconnect(email_config):
     """Test disconnecting from email servers."""
     client = EmailClient(email_config)
@@ -263,7 +210,6 @@ async def test_disconnect(email_config):
     assert client._smtp is None
 
 
-@pytest.mark.asyncio
 async def test_context_manager(email_config):
     """Test async context manager functionality."""
     client = EmailClient(email_config)
@@ -279,34 +225,22 @@ async def test_context_manager(email_config):
     mock_disconnect.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_smtp_starttls_error_handling(email_config):
+async def test_smtp_starttls_error_handling(email_config, mock_servers):
     """Test SMTP STARTTLS error handling."""
+    _, mock_smtp = mock_servers
+    mock_smtp.starttls.side_effect = Exception("STARTTLS failed")
     client = EmailClient(email_config)
 
-    mock_smtp = AsyncMock()
-    mock_smtp.connect = AsyncMock()
-    mock_smtp.starttls = AsyncMock(side_effect=Exception("STARTTLS failed"))
-    mock_smtp.login = AsyncMock()
-
-    with patch('aioimaplib.IMAP4_SSL', return_value=AsyncMock()), \
-            patch('aiosmtplib.SMTP', return_value=mock_smtp), \
-            pytest.raises(Exception):  # Should raise for port 587
+    with pytest.raises(Exception):  # Should raise for port 587
         await client.connect()
 
 
-@pytest.mark.asyncio
-async def test_smtp_starttls_error_handling_port_25(email_config):
+async def test_smtp_starttls_error_handling_port_25(email_config, mock_servers):
     """Test SMTP STARTTLS error handling for port 25."""
+    _, mock_smtp = mock_servers
+    mock_smtp.starttls.side_effect = Exception("STARTTLS failed")
     email_config.smtp_port = 25
     client = EmailClient(email_config)
 
-    mock_smtp = AsyncMock()
-    mock_smtp.connect = AsyncMock()
-    mock_smtp.starttls = AsyncMock(side_effect=Exception("STARTTLS failed"))
-    mock_smtp.login = AsyncMock()
-
-    with patch('aioimaplib.IMAP4_SSL', return_value=AsyncMock()), \
-            patch('aiosmtplib.SMTP', return_value=mock_smtp):
-        # Should not raise for port 25
-        await client.connect()
+    # Should not raise for port 25
+    await client.connect()
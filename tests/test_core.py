@@ -1,67 +1,52 @@
 """Tests for core PyMailAI functionality."""
 
+import json
+
 import pytest
 from email.message import EmailMessage
 from datetime import datetime
-from unittest.mock import patch
 
 from pymailai.config import EmailConfig
 from pymailai.message import EmailData
 
 
-@pytest.fixture
-def mock_email_validator():
-    """Mock email validator to avoid real network calls."""
-    with patch('email_validator.validate_email') as mock_validate:
-        def validate_side_effect(email):
-            if email == "not-an-email":
-                from email_validator import EmailNotValidError
-                raise EmailNotValidError("Invalid email format")
-            return True
-        mock_validate.side_effect = validate_side_effect
-        yield mock_validate
-
-
-def test_email_config_validation(mock_email_validator):
+def fake_validate_email(email):
+    """Reject "not-an-email" like email_validator, without network calls."""
+    if email == "not-an-email":
+        raise ValueError("Invalid email format")
+    return True
+
+
+VALID_CONFIG = {
+    "imap_server": "imap.gmail.com",
+    "smtp_server": "smtp.gmail.com",
+    "email": "test@example.com",
+    "password": "secret",
+}
+
+
+@pytest.mark.parametrize(
+    "changes, error",
+    [
+        ({}, None),
+        ({"email": "not-an-email"}, "Invalid email address"),
+        ({"password": ""}, "Password cannot be empty"),
+        (
+            {"imap_server": "", "smtp_server": ""},
+            "IMAP and SMTP servers must be specified",
+        ),
+    ],
+    ids=["valid", "invalid-email", "missing-password", "missing-servers"],
+)
+def test_email_config_validation(changes, error):
     """Test EmailConfig validation."""
-    # Valid configuration
-    config = EmailConfig(
-        imap_server="imap.gmail.com",
-        smtp_server="smtp.gmail.com",
-        email="test@example.com",
-        password="secret"
-    )
-    config.validate()  # Should not raise
-
-    # Invalid email
-    with pytest.raises(ValueError, match="Invalid email address"):
-        config = EmailConfig(
-            imap_server="imap.gmail.com",
-            smtp_server="smtp.gmail.com",
-            email="not-an-email",
-            password="secret"
-        )
-        config.validate()
-
-    # Missing password
-    with pytest.raises(ValueError, match="Password cannot be empty"):
-        config = EmailConfig(
-            imap_server="imap.gmail.com",
-            smtp_server="smtp.gmail.com",
-            email="test@example.com",
-            password=""
-        )
-        config.validate()
-
-    # Missing servers
-    with pytest.raises(ValueError, match="IMAP and SMTP servers must be specified"):
-        config = EmailConfig(
-            imap_server="",
-            smtp_server="",
-            email="test@example.com",
-            password="secret"
-        )
-        config.validate()
+    config = EmailConfig(**{**VALID_CONFIG, **changes})
+
+    if error is None:
+        config.validate(fake_validate_email)  # Should not raise
+    else:
+        with pytest.raises(ValueError, match=error):
+            config.validate(fake_validate_email)
 
 
 def test_email_data_conversion():
@@ -122,7 +107,70 @@ def test_email_data_multipart():
 
     # Verify multipart structure is preserved
     assert new_msg.is_multipart()
-    parts = list(new_msg.iter_parts())
-    assert len(parts) == 2
-    assert "Plain text content" in parts[0].get_content()
-    assert "<p>HTML content</p>" in parts[1].get_content()
+    # Unpacking also checks that there are exactly two parts
+    plain_part, html_part = new_msg.iter_parts()
+    assert "Plain text content" in plain_part.get_content()
+    assert "<p>HTML content</p>" in html_part.get_content()
+
+
+async def test_query_emails_keeps_results_before_error():
+    """Test that a failing query still returns the emails read before it."""
+    from pymailai.tools.core import execute_query_emails
+
+    class FailingClient:
+        async def query_messages(self, query_params):
+            yield EmailData(
+                message_id="msg1",
+                subject="First",
+                from_address="sender@example.com",
+                to_addresses=["recipient@example.com"],
+                timestamp=datetime(2024, 1, 1, 12, 0),
+                labels=frozenset({"INBOX", "UNREAD"}),
+            )
+            raise RuntimeError("connection lost")
+
+    results = await execute_query_emails(FailingClient(), subject="First")
+
+    assert [result.get("id") for result in results] == ["msg1", None]
+    assert results[0]["date"] == "2024-01-01T12:00:00"
+    assert results[0]["unread"] is True
+    assert results[1] == {"error": "connection lost"}
+
+
+async def test_iter_query_emails_yields_each_result():
+    """Test that query results are yielded as the client produces them."""
+    from pymailai.tools import iter_query_emails
+
+    class Client:
+        async def query_messages(self, query_params):
+            assert query_params == {"unread_only": True}
+            for i in range(2):
+                yield EmailData(
+                    message_id=f"msg{i}",
+                    subject="Subject",
+                    from_address="sender@example.com",
+                    to_addresses=["recipient@example.com"],
+                )
+
+    results = iter_query_emails(Client(), unread_only=True)
+
+    assert (await results.__anext__())["id"] == "msg0"
+    assert [result["id"] async for result in results] == ["msg1"]
+
+
+async def test_send_email_result_is_json_serializable(monkeypatch):
+    """Test that each send result is a fresh dict that can be sent as JSON."""
+    from pymailai.tools import execute_send_email
+
+    # The placeholder "me" sender is not a valid address for EmailData
+    monkeypatch.setattr("pymailai.tools.core.EmailData", dict)
+
+    class Client:
+        async def send_message(self, message):
+            pass
+
+    first = await execute_send_email(Client(), ["a@example.com"], "Hi", "Body")
+    second = await execute_send_email(Client(), ["a@example.com"], "Hi", "Body")
+
+    assert json.dumps(first) == '{"success": true, "error": ""}'
+    assert first is not second
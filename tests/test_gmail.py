@@ -1,8 +1,9 @@
 """Tests for Gmail OAuth functionality."""
 
+import io
 import json
 from pathlib import Path
-from unittest.mock import mock_open, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -11,7 +12,7 @@ from pymailai.gmail import (GmailCredentials, InvalidCredentialsError,
                           create_from_oauth_credentials, load_credentials)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_creds_dict():
     """Create valid test credentials."""
     return {
@@ -23,15 +24,21 @@ def valid_creds_dict():
     }
 
 
-@pytest.fixture
-def valid_creds_file(tmp_path, valid_creds_dict):
+@pytest.fixture(scope="session")
+def valid_creds_file(tmp_path_factory, valid_creds_dict):
     """Create a valid credentials file."""
-    creds_file = tmp_path / "gmail_creds.json"
+    creds_file = tmp_path_factory.mktemp("creds") / "gmail_creds.json"
     with open(creds_file, "w") as f:
         json.dump(valid_creds_dict, f)
     return creds_file
 
 
+@pytest.fixture(scope="session")
+def valid_creds(valid_creds_dict):
+    """Create valid test credentials once per session."""
+    return GmailCredentials(**valid_creds_dict)
+
+
 def test_load_credentials(valid_creds_file, valid_creds_dict):
     """Test loading credentials from a file."""
     creds = load_credentials(valid_creds_file)
@@ -49,14 +56,14 @@ def test_load_nonexistent_file():
         load_credentials("nonexistent.json")
 
 
-def test_load_invalid_json(tmp_path):
+def test_load_invalid_json(monkeypatch):
     """Test error handling for invalid JSON in credentials file."""
-    invalid_file = tmp_path / "invalid.json"
-    with open(invalid_file, "w") as f:
-        f.write("not valid json")
+    monkeypatch.setattr(
+        "builtins.open", lambda *args, **kwargs: io.StringIO("not valid json")
+    )
 
     with pytest.raises(InvalidCredentialsError, match="Invalid JSON"):
-        load_credentials(invalid_file)
+        load_credentials("invalid.json")
 
 
 def test_create_from_oauth_credentials(tmp_path):
@@ -92,9 +99,9 @@ def test_create_from_oauth_credentials_no_save():
     assert creds.refresh_token == "test-refresh-token"
 
 
-def test_to_email_config(valid_creds_dict):
+def test_to_email_config(valid_creds):
     """Test converting credentials to EmailConfig."""
-    creds = GmailCredentials(**valid_creds_dict)
+    creds = valid_creds
     config = creds.to_email_config()
 
     assert isinstance(config, EmailConfig)
@@ -1,43 +1,115 @@
 """Tests for GmailClient class."""
 
 import base64
+import threading
+import time
+from contextlib import nullcontext
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
 from pymailai.gmail_client import GmailClient
 from pymailai.message import EmailData
 
+# Gmail API body data of a plain "Test message" body
+TEST_MESSAGE_DATA = base64.urlsafe_b64encode(b"Test message").decode()
+
+# Full Gmail API response for a single part text message
+SINGLE_PART_MESSAGE = {
+    "id": "msg1",
+    "threadId": "thread1",
+    "internalDate": "1706179200000",
+    "payload": {
+        "headers": [
+            {"name": "From", "value": "sender@example.com"},
+            {"name": "To", "value": "recipient@example.com"},
+            {"name": "Subject", "value": "Test Subject"},
+            {"name": "Date", "value": "Thu, 25 Jan 2024 10:00:00 +0000"},
+            {"name": "References", "value": ""},
+        ],
+        "mimeType": "text/plain",
+        "body": {"data": TEST_MESSAGE_DATA},
+    },
+}
+
+class BatchRequestMock:
+    """Helper class that executes batched requests one by one for testing."""
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            try:
+                response, exception = request.execute(), None
+            except Exception as e:
+                response, exception = None, e
+            self.callback(request_id, response, exception)
+
+
+class SharedHttpRequestMock:
+    """Request factory recording how many requests execute at the same time."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def __call__(self, userId, id, **kwargs):
+        request = MagicMock()
+
+        def execute():
+            with self.lock:
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            # Give overlapping executions a chance to be observed
+            time.sleep(0.01)
+            with self.lock:
+                self.active -= 1
+            return {**SINGLE_PART_MESSAGE, "id": id}
+
+        request.execute.side_effect = execute
+        return request
+
 
 @pytest.fixture
 def mock_gmail_service():
     """Create a mock Gmail service."""
-    mock_service = MagicMock()
-    return mock_service
+    # A new mock per test: tests configure children deep inside it, e.g.
+    # users().messages().get, which reset_mock() does not fully restore
+    service = MagicMock()
+    service.new_batch_http_request.side_effect = BatchRequestMock
+    return service
 
 
 @pytest.fixture
-def gmail_client(mock_gmail_service):
+async def gmail_client(mock_gmail_service):
     """Create a GmailClient instance with mock service."""
-    return GmailClient(mock_gmail_service)
+    client = GmailClient(mock_gmail_service)
+    yield client
+    # Shut down the thread pool the client creates on its first request
+    await client.disconnect()
 
 
-@pytest.mark.asyncio
-async def test_mark_as_read(gmail_client, mock_gmail_service):
-    """Test marking a message as read."""
+@pytest.mark.parametrize(
+    "side_effect", [None, Exception("API error")], ids=["success", "api-error"]
+)
+async def test_mark_as_read(gmail_client, mock_gmail_service, side_effect):
+    """Test marking a message as read, which never raises on API errors."""
     message_id = "test_message_id"
 
     # Set up mock
     mock_modify = mock_gmail_service.users.return_value.messages.return_value.modify
     mock_modify.return_value.execute.return_value = {"id": message_id}
+    mock_modify.return_value.execute.side_effect = side_effect
 
-    # Call mark_as_read
+    # Call mark_as_read - should not raise exception
     await gmail_client.mark_as_read(message_id)
 
     # Verify the API was called correctly
-    mock_gmail_service.users.assert_called_once_with()
-    mock_gmail_service.users().messages.assert_called_once_with()
     mock_modify.assert_called_once_with(
         userId="me",
         id=message_id,
@@ -46,64 +118,17 @@ async def test_mark_as_read(gmail_client, mock_gmail_service):
     mock_modify.return_value.execute.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_mark_as_read_error_handling(gmail_client, mock_gmail_service):
-    """Test error handling when marking a message as read."""
-    message_id = "test_message_id"
-
-    # Set up mock to raise an exception
-    mock_modify = mock_gmail_service.users.return_value.messages.return_value.modify
-    mock_modify.return_value.execute.side_effect = Exception("API error")
-
-    # Call mark_as_read - should not raise exception
-    await gmail_client.mark_as_read(message_id)
-
-    # Verify the API was called
-    mock_modify.assert_called_once_with(
-        userId="me",
-        id=message_id,
-        body={"removeLabelIds": ["UNREAD"]}
-    )
-
-
-@pytest.mark.asyncio
 async def test_fetch_new_messages_single_part(gmail_client, mock_gmail_service):
     """Test fetching single part text message."""
     mock_list = mock_gmail_service.users.return_value.messages.return_value.list
     mock_get = mock_gmail_service.users.return_value.messages.return_value.get
-    mock_threads = mock_gmail_service.users.return_value.threads.return_value.get
 
     mock_list.return_value.execute.return_value = {
         "messages": [{"id": "msg1"}]
     }
 
-    # Mock metadata request for thread ID
-    mock_get.return_value.execute.return_value = {
-        "id": "msg1",
-        "threadId": "thread1"
-    }
-
-    # Mock thread request
-    mock_threads.return_value.execute.return_value = {
-        "messages": [{
-            "id": "msg1",
-            "threadId": "thread1",
-            "internalDate": "1706179200000",
-            "payload": {
-                    "headers": [
-                        {"name": "From", "value": "sender@example.com"},
-                        {"name": "To", "value": "recipient@example.com"},
-                        {"name": "Subject", "value": "Test Subject"},
-                        {"name": "Date", "value": "Thu, 25 Jan 2024 10:00:00 +0000"},
-                        {"name": "References", "value": ""}
-                    ],
-                "mimeType": "text/plain",
-                "body": {
-                    "data": base64.urlsafe_b64encode(b"Test message").decode()
-                }
-            }
-        }]
-    }
+    # Mock full message request
+    mock_get.return_value.execute.return_value = SINGLE_PART_MESSAGE
 
     messages = []
     async for msg in gmail_client.fetch_new_messages():
@@ -114,54 +139,44 @@ async def test_fetch_new_messages_single_part(gmail_client, mock_gmail_service):
     assert messages[0].body_html is None
 
 
-@pytest.mark.asyncio
 async def test_fetch_new_messages_multipart_alternative(gmail_client, mock_gmail_service):
     """Test fetching multipart/alternative message with text and HTML parts."""
     mock_list = mock_gmail_service.users.return_value.messages.return_value.list
     mock_get = mock_gmail_service.users.return_value.messages.return_value.get
-    mock_threads = mock_gmail_service.users.return_value.threads.return_value.get
 
     mock_list.return_value.execute.return_value = {
         "messages": [{"id": "msg1"}]
     }
 
-    # Mock metadata request for thread ID
+    # Mock full message request
     mock_get.return_value.execute.return_value = {
         "id": "msg1",
-        "threadId": "thread1"
-    }
-
-    # Mock thread request
-    mock_threads.return_value.execute.return_value = {
-        "messages": [{
-            "id": "msg1",
-            "threadId": "thread1",
-            "internalDate": "1706179200000",
-            "payload": {
-                    "headers": [
-                        {"name": "From", "value": "sender@example.com"},
-                        {"name": "To", "value": "recipient@example.com"},
-                        {"name": "Subject", "value": "Test Subject"},
-                        {"name": "Date", "value": "Thu, 25 Jan 2024 10:00:00 +0000"},
-                        {"name": "References", "value": ""}
-                    ],
-                "mimeType": "multipart/alternative",
-                "parts": [
-                    {
-                        "mimeType": "text/plain",
-                        "body": {
-                            "data": base64.urlsafe_b64encode(b"Plain text").decode()
-                        }
-                    },
-                    {
-                        "mimeType": "text/html",
-                        "body": {
-                            "data": base64.urlsafe_b64encode(b"<p>HTML content</p>").decode()
-                        }
+        "threadId": "thread1",
+        "internalDate": "1706179200000",
+        "payload": {
+                "headers": [
+                    {"name": "From", "value": "sender@example.com"},
+                    {"name": "To", "value": "recipient@example.com"},
+                    {"name": "Subject", "value": "Test Subject"},
+                    {"name": "Date", "value": "Thu, 25 Jan 2024 10:00:00 +0000"},
+                    {"name": "References", "value": ""}
+                ],
+            "mimeType": "multipart/alternative",
+            "parts": [
+                {
+                    "mimeType": "text/plain",
+                    "body": {
+                        "data": base64.urlsafe_b64encode(b"Plain text").decode()
                     }
-                ]
-            }
-        }]
+                },
+                {
+                    "mimeType": "text/html",
+                    "body": {
+                        "data": base64.urlsafe_b64encode(b"<p>HTML content</p>").decode()
+                    }
+                }
+            ]
+        }
     }
 
     messages = []
@@ -173,47 +188,38 @@ async def test_fetch_new_messages_multipart_alternative(gmail_client, mock_gmail
     assert messages[0].body_html == "<p>HTML content</p>"
 
 
-@pytest.mark.asyncio
 async def test_fetch_new_messages_multipart_mixed_nested(gmail_client, mock_gmail_service):
     """Test fetching multipart/mixed message with nested multipart/alternative."""
     mock_list = mock_gmail_service.users.return_value.messages.return_value.list
     mock_get = mock_gmail_service.users.return_value.messages.return_value.get
-    mock_threads = mock_gmail_service.users.return_value.threads.return_value.get
 
     mock_list.return_value.execute.return_value = {
         "messages": [{"id": "msg1"}]
     }
 
-    # Mock metadata request for thread ID
+    # Mock full message request
     mock_get.return_value.execute.return_value = {
         "id": "msg1",
-        "threadId": "thread1"
-    }
-
-    # Mock thread request
-    mock_threads.return_value.execute.return_value = {
-        "messages": [{
-            "id": "msg1",
-            "threadId": "thread1",
-            "internalDate": "1706179200000",
-            "payload": {
-                    "headers": [
-                        {"name": "From", "value": "sender@example.com"},
-                        {"name": "To", "value": "recipient@example.com"},
-                        {"name": "Subject", "value": "Test Subject"},
-                        {"name": "Date", "value": "Thu, 25 Jan 2024 10:00:00 +0000"},
-                        {"name": "Message-ID", "value": "<test123@example.com>"},
-                        {"name": "References", "value": ""}
-                    ],
-                "mimeType": "multipart/mixed",
-                "parts": [
-                    {
-                        "mimeType": "multipart/alternative",
-                        "parts": [
-                            {
-                                "mimeType": "text/plain",
-                                "body": {
-                                    "data": base64.urlsafe_b64encode(b"""Hello!
+        "threadId": "thread1",
+        "internalDate": "1706179200000",
+        "payload": {
+                "headers": [
+                    {"name": "From", "value": "sender@example.com"},
+                    {"name": "To", "value": "recipient@example.com"},
+                    {"name": "Subject", "value": "Test Subject"},
+                    {"name": "Date", "value": "Thu, 25 Jan 2024 10:00:00 +0000"},
+                    {"name": "Message-ID", "value": "<test123@example.com>"},
+                    {"name": "References", "value": ""}
+                ],
+            "mimeType": "multipart/mixed",
+            "parts": [
+                {
+                    "mimeType": "multipart/alternative",
+                    "parts": [
+                        {
+                            "mimeType": "text/plain",
+                            "body": {
+                                "data": base64.urlsafe_b64encode(b"""Hello!
 
 Here's a test message with multiple sections:
 
@@ -228,26 +234,25 @@ Next steps:
 
 Best regards,
 Test User""").decode()
-                                }
-                            },
-                            {
-                                "mimeType": "text/html",
-                                "body": {
-                                    "data": base64.urlsafe_b64encode(b"""<div dir="ltr">Hello!<br><br>Here's a test message with multiple sections:<br><br>- Section 1: Testing<br>- Section 2: Verification<br>- Section 3: Validation<br><br>Next steps:<br>1. Check plain text extraction<br>2. Verify HTML content<br>3. Confirm attachment handling<br><br>Best regards,<br>Test User</div>""").decode()
-                                }
                             }
-                        ]
-                    },
-                    {
-                        "mimeType": "application/pdf",
-                        "filename": "test.pdf",
-                        "body": {
-                            "attachmentId": "attachment123"
+                        },
+                        {
+                            "mimeType": "text/html",
+                            "body": {
+                                "data": base64.urlsafe_b64encode(b"""<div dir="ltr">Hello!<br><br>Here's a test message with multiple sections:<br><br>- Section 1: Testing<br>- Section 2: Verification<br>- Section 3: Validation<br><br>Next steps:<br>1. Check plain text extraction<br>2. Verify HTML content<br>3. Confirm attachment handling<br><br>Best regards,<br>Test User</div>""").decode()
+                            }
                         }
+                    ]
+                },
+                {
+                    "mimeType": "application/pdf",
+                    "filename": "test.pdf",
+                    "body": {
+                        "attachmentId": "attachment123"
                     }
-                ]
-            }
-        }]
+                }
+            ]
+        }
     }
 
     messages = []
@@ -272,7 +277,6 @@ Test User""").decode()
     assert "<br>Test User</div>" in messages[0].body_html
 
 
-@pytest.mark.asyncio
 async def test_fetch_new_messages_no_messages(gmail_client, mock_gmail_service):
     """Test fetching when there are no new messages."""
     # Set up mock to return no messages
@@ -291,11 +295,10 @@ async def test_fetch_new_messages_no_messages(gmail_client, mock_gmail_service):
     mock_list.assert_called_once_with(userId="me", q="is:unread -in:chats")
 
 
-@pytest.mark.asyncio
-async def test_send_message(gmail_client, mock_gmail_service):
-    """Test sending a message."""
-    # Create test message
-    message = EmailData(
+@pytest.fixture(scope="module")
+def sample_email():
+    """Create the message sent by the send tests."""
+    return EmailData(
         message_id="test123",
         subject="Test Subject",
         from_address="sender@example.com",
@@ -303,42 +306,342 @@ async def test_send_message(gmail_client, mock_gmail_service):
         cc_addresses=[],
         body_text="Test message",
         body_html=None,
-        timestamp=datetime.now()
+        timestamp=datetime(2024, 1, 1),
     )
 
+
+@pytest.mark.parametrize(
+    "side_effect, expectation",
+    [
+        (None, nullcontext()),
+        (Exception("API error"), pytest.raises(Exception, match="API error")),
+    ],
+    ids=["success", "api-error"],
+)
+async def test_send_message(
+    gmail_client, mock_gmail_service, sample_email, side_effect, expectation
+):
+    """Test sending a message, which raises API errors to the caller."""
     # Set up mock
     mock_send = mock_gmail_service.users.return_value.messages.return_value.send
     mock_send.return_value.execute.return_value = {"id": "msg1"}
+    mock_send.return_value.execute.side_effect = side_effect
 
     # Send message
-    await gmail_client.send_message(message)
+    with expectation:
+        await gmail_client.send_message(sample_email)
 
     # Verify API calls
-    mock_gmail_service.users.assert_called_once_with()
-    mock_gmail_service.users().messages.assert_called_once_with()
-    mock_send.assert_called_once()
+    mock_send.assert_called_once_with(userId="me", body=ANY)
     mock_send.return_value.execute.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_send_message_error_handling(gmail_client, mock_gmail_service):
-    """Test error handling when sending a message."""
-    # Create test message
-    message = EmailData(
-        message_id="test123",
-        subject="Test Subject",
-        from_address="sender@example.com",
-        to_addresses=["recipient@example.com"],
-        cc_addresses=[],
-        body_text="Test message",
-        body_html=None,
-        timestamp=datetime.now()
-    )
+def test_extract_message_content_nested_payloads(gmail_client):
+    """Test extracting the bodies of nested multipart payloads."""
+    def payload(text, html):
+        return {
+            "mimeType": "multipart/mixed",
+            "parts": [
+                {
+                    "mimeType": "multipart/alternative",
+                    "parts": [
+                        {
+                            "mimeType": "text/plain",
+                            "body": {"data": base64.urlsafe_b64encode(text).decode()}
+                        },
+                        {
+                            "mimeType": "text/html",
+                            "body": {"data": base64.urlsafe_b64encode(html).decode()}
+                        }
+                    ]
+                },
+                {
+                    "mimeType": "application/pdf",
+                    "filename": "test.pdf",
+                    "body": {"attachmentId": "attachment123"}
+                }
+            ]
+        }
 
-    # Set up mock to raise an exception
-    mock_send = mock_gmail_service.users.return_value.messages.return_value.send
-    mock_send.return_value.execute.side_effect = Exception("API error")
+    first = gmail_client._extract_message_content(payload(b"First", b"<p>First</p>"))
+    second = gmail_client._extract_message_content(payload(b"Second", b"<p>Second</p>"))
+
+    assert first == ("First", "<p>First</p>")
+    assert second == ("Second", "<p>Second</p>")
+
+
+def test_extract_message_content_stops_after_bodies(gmail_client):
+    """Test that parts after the text and HTML bodies are not inspected."""
+    class UnvisitedPart(dict):
+        def get(self, *args):
+            raise AssertionError("part should not be visited")
+
+    payload = {
+        "mimeType": "multipart/mixed",
+        "parts": [
+            {
+                "mimeType": "text/plain",
+                "body": {"data": base64.urlsafe_b64encode(b"Text").decode()}
+            },
+            {
+                "mimeType": "text/html",
+                "body": {"data": base64.urlsafe_b64encode(b"<p>Html</p>").decode()}
+            },
+            UnvisitedPart()
+        ]
+    }
+
+    assert gmail_client._extract_message_content(payload) == ("Text", "<p>Html</p>")
+
+
+async def test_fetch_new_messages_batches_requests(gmail_client, mock_gmail_service):
+    """Test that message and thread lookups are sent as batch requests."""
+    mock_list = mock_gmail_service.users.return_value.messages.return_value.list
+    mock_get = mock_gmail_service.users.return_value.messages.return_value.get
+    mock_threads = mock_gmail_service.users.return_value.threads.return_value.get
+
+    mock_list.return_value.execute.return_value = {
+        "messages": [{"id": "msg1"}, {"id": "msg2"}]
+    }
+    reply = {
+        "id": "msg2",
+        "threadId": "thread1",
+        "internalDate": "1706179200000",
+        "payload": {
+            "headers": [
+                {"name": "From", "value": "sender@example.com"},
+                {"name": "To", "value": "recipient@example.com"},
+                {"name": "Subject", "value": "Re: Test Subject"},
+                {"name": "In-Reply-To", "value": "<original@example.com>"},
+            ],
+            "mimeType": "text/plain",
+            "body": {
+                "data": base64.urlsafe_b64encode(b"Reply message").decode()
+            }
+        }
+    }
+    mock_get.return_value.execute.return_value = reply
+    mock_threads.return_value.execute.return_value = {"messages": [reply]}
+
+    messages = []
+    async for msg in gmail_client.fetch_new_messages():
+        messages.append(msg)
+
+    assert [msg.message_id for msg in messages] == ["msg1", "msg2"]
+    assert mock_gmail_service.new_batch_http_request.call_count == 2
+    mock_threads.assert_called_once_with(userId="me", id="thread1")
+
+
+async def test_fetch_new_messages_skips_thread_for_new_message(
+    gmail_client, mock_gmail_service
+):
+    """Test that no thread is fetched for a message that is not a reply."""
+    mock_list = mock_gmail_service.users.return_value.messages.return_value.list
+    mock_get = mock_gmail_service.users.return_value.messages.return_value.get
+    mock_threads = mock_gmail_service.users.return_value.threads.return_value.get
+
+    mock_list.return_value.execute.return_value = {"messages": [{"id": "msg1"}]}
+    mock_get.return_value.execute.return_value = {
+        "id": "msg1",
+        "threadId": "thread1",
+        "internalDate": "1706179200000",
+        "payload": {
+            "headers": [
+                {"name": "From", "value": "sender@example.com"},
+                {"name": "References", "value": ""},
+            ],
+            "mimeType": "text/plain",
+            "body": {
+                "data": TEST_MESSAGE_DATA
+            }
+        }
+    }
+
+    messages = []
+    async for msg in gmail_client.fetch_new_messages():
+        messages.append(msg)
+
+    assert len(messages) == 1
+    assert messages[0].body_text == "Test message"
+    mock_get.assert_called_once_with(userId="me", id="msg1", format="full")
+    mock_threads.assert_not_called()
+
+
+async def test_fetch_new_messages_header_names_ignore_case(
+    gmail_client, mock_gmail_service
+):
+    """Test that headers are read regardless of the case of their names."""
+    mock_list = mock_gmail_service.users.return_value.messages.return_value.list
+    mock_get = mock_gmail_service.users.return_value.messages.return_value.get
+
+    mock_list.return_value.execute.return_value = {"messages": [{"id": "msg1"}]}
+    mock_get.return_value.execute.return_value = {
+        "id": "msg1",
+        "threadId": "thread1",
+        "internalDate": "1706179200000",
+        "payload": {
+            "headers": [
+                {"name": "subject", "value": "Lowercase"},
+                {"name": "FROM", "value": "sender@example.com"},
+                {"name": "date", "value": "Thu, 25 Jan 2024 10:00:00 +0000"},
+            ],
+            "mimeType": "text/plain",
+            "body": {
+                "data": TEST_MESSAGE_DATA
+            }
+        }
+    }
+
+    messages = []
+    async for msg in gmail_client.fetch_new_messages():
+        messages.append(msg)
+
+    assert len(messages) == 1
+    assert messages[0].subject == "Lowercase"
+    assert messages[0].from_address == "sender@example.com"
+    assert messages[0].timestamp.hour == 10
+
+
+async def test_fetch_new_messages_batch_fallback(gmail_client, mock_gmail_service):
+    """Test falling back to single requests when a batch request fails."""
+    mock_gmail_service.new_batch_http_request.side_effect = Exception("Batch error")
+    mock_list = mock_gmail_service.users.return_value.messages.return_value.list
+    mock_get = mock_gmail_service.users.return_value.messages.return_value.get
+
+    mock_list.return_value.execute.return_value = {"messages": [{"id": "msg1"}]}
+    mock_get.return_value.execute.return_value = {
+        "id": "msg1",
+        "threadId": "thread1",
+        "internalDate": "1706179200000",
+        "payload": {
+            "headers": [{"name": "From", "value": "sender@example.com"}],
+            "mimeType": "text/plain",
+            "body": {
+                "data": TEST_MESSAGE_DATA
+            }
+        }
+    }
+
+    messages = []
+    async for msg in gmail_client.fetch_new_messages():
+        messages.append(msg)
+
+    assert len(messages) == 1
+    assert messages[0].body_text == "Test message"
+
+
+async def test_fetch_new_messages_failed_batch_items(
+    gmail_client, mock_gmail_service, caplog
+):
+    """Test that failed items in a batch only affect their own message."""
+    mock_list = mock_gmail_service.users.return_value.messages.return_value.list
+    mock_get = mock_gmail_service.users.return_value.messages.return_value.get
+    mock_threads = mock_gmail_service.users.return_value.threads.return_value.get
+
+    mock_list.return_value.execute.return_value = {
+        "messages": [{"id": "msg1"}, {"id": "msg2"}]
+    }
+
+    def get_request(userId, id, **kwargs):
+        request = MagicMock()
+        if id == "msg1":
+            request.execute.side_effect = Exception("API error")
+        else:
+            request.execute.return_value = {
+                "id": "msg2",
+                "threadId": "thread1",
+                "internalDate": "1706179200000",
+                "payload": {
+                    "headers": [
+                        {"name": "From", "value": "sender@example.com"},
+                        {"name": "In-Reply-To", "value": "<original@example.com>"},
+                    ],
+                    "mimeType": "text/plain",
+                    "body": {"data": TEST_MESSAGE_DATA},
+                },
+            }
+        return request
+
+    mock_get.side_effect = get_request
+    mock_threads.return_value.execute.side_effect = Exception("Thread error")
+
+    messages = [msg async for msg in gmail_client.fetch_new_messages()]
+
+    assert [msg.message_id for msg in messages] == ["msg2"]
+    assert messages[0].body_text == "Test message"
+    assert "Skipping message msg1: lookup failed" in caplog.text
+
+
+async def test_query_messages_skips_failed_gets(gmail_client, mock_gmail_service):
+    """Test that a failed message lookup does not drop the other results."""
+    mock_list = mock_gmail_service.users.return_value.messages.return_value.list
+    mock_get = mock_gmail_service.users.return_value.messages.return_value.get
+
+    mock_list.return_value.execute.return_value = {
+        "messages": [{"id": "msg1"}, {"id": "msg2"}]
+    }
+
+    def get_request(userId, id, **kwargs):
+        request = MagicMock()
+        if id == "msg1":
+            request.execute.side_effect = Exception("API error")
+        else:
+            request.execute.return_value = {
+                "internalDate": "1706179200000",
+                "labelIds": ["INBOX", "UNREAD"],
+                "payload": {
+                    "headers": [
+                        {"name": "From", "value": "sender@example.com"},
+                        {"name": "Subject", "value": "Second"},
+                    ]
+                }
+            }
+        return request
+
+    mock_get.side_effect = get_request
+
+    messages = []
+    async for msg in gmail_client.query_messages({"subject": "Second"}):
+        messages.append(msg)
+
+    assert [msg.message_id for msg in messages] == ["msg2"]
+    assert messages[0].subject == "Second"
+    assert messages[0].labels == frozenset({"INBOX", "UNREAD"})
+
+
+async def test_disconnect_shuts_down_executor(gmail_client, mock_gmail_service):
+    """Test that API requests run on the client's own thread pool."""
+    mock_modify = mock_gmail_service.users.return_value.messages.return_value.modify
+    mock_modify.return_value.execute.return_value = {}
+
+    await gmail_client.mark_as_read("msg123")
+    executor = gmail_client._executor
+    assert executor is not None
+    # A single worker keeps requests off the shared HTTP connection at once
+    assert executor._max_workers == 1
+
+    await gmail_client.disconnect()
+    assert gmail_client._executor is None
+    assert executor._shutdown
+
+
+@pytest.mark.parametrize("batch_fails", [False, True], ids=["batch", "fallback"])
+async def test_requests_do_not_share_http_concurrently(
+    gmail_client, mock_gmail_service, batch_fails
+):
+    """Test that requests on the shared HTTP connection never overlap."""
+    if batch_fails:
+        mock_gmail_service.new_batch_http_request.side_effect = Exception("Batch error")
+    mock_list = mock_gmail_service.users.return_value.messages.return_value.list
+    mock_get = mock_gmail_service.users.return_value.messages.return_value.get
+
+    mock_list.return_value.execute.return_value = {
+        "messages": [{"id": f"msg{i}"} for i in range(5)]
+    }
+    mock_get.side_effect = requests = SharedHttpRequestMock()
+
+    fetched = [msg.message_id async for msg in gmail_client.fetch_new_messages()]
+    queried = [msg.message_id async for msg in gmail_client.query_messages({})]
 
-    # Send message - should raise exception
-    with pytest.raises(Exception):
-        await gmail_client.send_message(message)
+    assert fetched == queried == [f"msg{i}" for i in range(5)]
+    assert requests.max_active == 1
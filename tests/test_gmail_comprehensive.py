@@ -1,9 +1,10 @@
 """Comprehensive tests for Gmail OAuth functionality."""
 
+import io
 import json
 import os
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, mock_open, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from google.auth import credentials
@@ -55,12 +56,12 @@ def gmail_creds(oauth_creds):
     )
 
 
-def test_load_credentials_success(oauth_creds):
+def test_load_credentials_success(oauth_creds, monkeypatch):
     """Test successful loading of credentials from file."""
-    mock_file = mock_open(read_data=json.dumps(oauth_creds))
+    data = json.dumps(oauth_creds)
+    monkeypatch.setattr("builtins.open", lambda *args, **kwargs: io.StringIO(data))
 
-    with patch("builtins.open", mock_file):
-        creds = load_credentials("fake_path.json")
+    creds = load_credentials("fake_path.json")
 
     assert creds.client_id == oauth_creds["client_id"]
     assert creds.client_secret == oauth_creds["client_secret"]
@@ -75,22 +76,23 @@ def test_load_credentials_file_not_found():
         load_credentials("nonexistent.json")
 
 
-def test_load_credentials_invalid_json():
+def test_load_credentials_invalid_json(monkeypatch):
     """Test handling of invalid JSON in credentials file."""
-    mock_file = mock_open(read_data="invalid json")
+    monkeypatch.setattr(
+        "builtins.open", lambda *args, **kwargs: io.StringIO("invalid json")
+    )
 
-    with patch("builtins.open", mock_file), \
-         pytest.raises(InvalidCredentialsError):
+    with pytest.raises(InvalidCredentialsError):
         load_credentials("fake_path.json")
 
 
-def test_load_credentials_missing_fields(oauth_creds):
+def test_load_credentials_missing_fields(oauth_creds, monkeypatch):
     """Test handling of missing required fields in credentials."""
     del oauth_creds["client_id"]
-    mock_file = mock_open(read_data=json.dumps(oauth_creds))
+    data = json.dumps(oauth_creds)
+    monkeypatch.setattr("builtins.open", lambda *args, **kwargs: io.StringIO(data))
 
-    with patch("builtins.open", mock_file), \
-         pytest.raises(InvalidCredentialsError):
+    with pytest.raises(InvalidCredentialsError):
         load_credentials("fake_path.json")
 
 
@@ -0,0 +1,46 @@
+"""Tests for the HTML converter module."""
+from pymailai.html_converter import HtmlConverter
+
+
+def test_convert_paragraphs_and_line_breaks():
+    """Test conversion of paragraphs and line breaks to text."""
+    html = '<div dir="ltr">Hello!<br><br>Line 2</div><p>Best,<br>Me</p>'
+    assert HtmlConverter.convert_html_to_text(html) == "Hello!\n\nLine 2\nBest,\nMe"
+
+
+def test_convert_quotes():
+    """Test that quoted content is moved after the main text and prefixed."""
+    html = (
+        "<p>Reply text</p>"
+        '<div class="gmail_quote">On Monday wrote:'
+        "<blockquote>Original<br>text</blockquote></div>"
+    )
+    assert HtmlConverter.convert_html_to_text(html) == (
+        "Reply text\n\n> On Monday wrote:Original\n> text"
+    )
+
+
+def test_convert_inline_elements_once():
+    """Test that inline text is kept once, with the spaces around it."""
+    html = "<html><body><p>Some <b>bold</b> text</p></body></html>"
+    assert HtmlConverter.convert_html_to_text(html) == "Some bold text"
+
+
+def test_convert_collapses_source_whitespace():
+    """Test that indentation and line breaks in the HTML source are collapsed."""
+    html = "<div>\n  <p>\n    First   line\n  </p>\n  <p>Second <i>line</i></p>\n</div>"
+    assert HtmlConverter.convert_html_to_text(html) == "First line\nSecond line"
+
+
+def test_convert_preformatted_text_keeps_whitespace():
+    """Test that line breaks and indentation inside <pre> are kept."""
+    html = "<p>Code:</p><pre>def f():\n    return  1\n</pre><p>Done</p>"
+    assert HtmlConverter.convert_html_to_text(html) == (
+        "Code:\ndef f():\n    return  1\n\nDone"
+    )
+
+
+def test_convert_keeps_non_breaking_spaces():
+    """Test that non-breaking spaces are not collapsed like other whitespace."""
+    html = "<p>A&nbsp;&nbsp;B  \n C</p>"
+    assert HtmlConverter.convert_html_to_text(html) == "A  B C"
@@ -62,3 +62,11 @@ def test_converter_reset():
     converter.convert(markdown_content)
     converter.reset()
     assert converter.convert(markdown_content).strip() == "<h1>Test</h1>"
+
+
+def test_converters_share_markdown_instance():
+    """Test converters with the same extensions reuse one Markdown instance."""
+    first = MarkdownConverter(extensions=["tables", "nl2br"])
+    second = MarkdownConverter(extensions=["nl2br", "tables"])
+    assert first.md is second.md
+    assert MarkdownConverter().md is not first.md
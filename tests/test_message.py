@@ -1,11 +1,15 @@
 """Tests for email message data structures and utilities."""
 
+import gc
+import weakref
 from datetime import datetime
+from email import message_from_string, policy
 from email.message import EmailMessage
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from pymailai.email_processor import EmailProcessor, LazyAttachment
 from pymailai.message import EmailData
 
 
@@ -85,6 +89,104 @@ def test_email_data_from_simple_message():
     assert email_data.attachments == []
 
 
+def test_email_data_from_message_parses_body_lazily():
+    """Test that the body is only decoded when it is first accessed."""
+    msg = create_email_message()
+
+    with patch(
+        "pymailai.message.EmailProcessor.process_message_parts",
+        wraps=EmailProcessor.process_message_parts,
+    ) as mock_process:
+        email_data = EmailData.from_email_message(msg)
+        assert email_data.subject == "Test Subject"
+        mock_process.assert_not_called()
+
+        assert email_data.body_text.rstrip() == "Test message"
+        assert email_data.body_html is None
+        assert email_data.attachments == []
+        mock_process.assert_called_once_with(msg)
+
+    assert email_data.timestamp == datetime.fromtimestamp(1704110400)
+
+
+def test_email_data_from_message_raises_parse_errors_on_access():
+    """Test that body decoding errors are raised by the first read."""
+    with patch(
+        "pymailai.message.EmailProcessor.process_message_parts",
+        side_effect=ValueError("bad part"),
+    ):
+        email_data = EmailData.from_email_message(create_email_message())
+
+        with pytest.raises(ValueError, match="bad part"):
+            email_data.body_text
+
+
+def test_email_data_releases_source_message():
+    """Test that the source message is dropped once every field is parsed."""
+    msg = create_email_message()
+    source = weakref.ref(msg)
+    email_data = EmailData.from_email_message(msg)
+    del msg
+    gc.collect()
+
+    assert email_data.body_text.rstrip() == "Test message"
+    assert source() is not None  # The timestamp is still unparsed
+
+    email_data.timestamp
+    gc.collect()
+    assert source() is None
+
+
+def test_email_data_lazy_and_eager_messages_are_equal():
+    """Test that equality compares parsed values, not parsing state."""
+    msg = create_email_message()
+    eager = EmailData.from_email_message(msg)
+    eager.body_text
+
+    assert EmailData.from_email_message(msg) == eager
+    assert EmailData.from_email_message(create_email_message(body_text="Other")) != eager
+
+def test_email_data_from_message_with_quoted_names():
+    """Test that commas inside quoted display names do not split addresses."""
+    msg = create_email_message()
+    del msg["To"]
+    msg["To"] = '"Doe, Jane" <jane@example.com>, bob@example.com'
+
+    email_data = EmailData.from_email_message(msg)
+
+    assert email_data.to_addresses == ["jane@example.com", "bob@example.com"]
+
+
+def test_email_data_from_message_with_repeated_headers():
+    """Test that addresses from repeated To headers are all kept."""
+    msg = message_from_string(
+        "From: sender@example.com\n"
+        "To: recipient@example.com\n"
+        "To: second@example.com\n"
+        "Subject: Test Subject\n"
+        "\n"
+        "Test message\n",
+        _class=EmailMessage,
+        policy=policy.default,
+    )
+
+    email_data = EmailData.from_email_message(msg)
+
+    assert email_data.to_addresses == ["recipient@example.com", "second@example.com"]
+
+
+def test_email_data_from_message_uses_declared_charset():
+    """Test that text parts are decoded with the charset they declare."""
+    msg = EmailMessage()
+    msg["From"] = "sender@example.com"
+    msg["To"] = "recipient@example.com"
+    msg.set_content("Caf\u00e9 menu", charset="iso-8859-1", cte="8bit")
+
+    email_data = EmailData.from_email_message(msg)
+
+    assert email_data.body_text.rstrip() == "Caf\u00e9 menu"
+
+
 def test_email_data_from_html_message():
     """Test creating EmailData from a message with HTML content."""
     html_content = "<html><body><p>Test message</p></body></html>"
@@ -115,6 +217,83 @@ def test_email_data_from_message_with_attachments():
     assert attachment["payload"] == b"test file content"
 
 
+def test_email_data_attachment_payload_is_lazy():
+    """Test that attachment payloads are decoded on access or streamed."""
+    payload = bytes(range(256)) * 1000
+    attachments = [
+        {
+            "payload": payload,
+            "maintype": "application",
+            "subtype": "octet-stream",
+            "filename": "data.bin",
+        }
+    ]
+    msg = create_email_message(attachments=attachments)
+    attachment = EmailData.from_email_message(msg).attachments[0]
+
+    assert isinstance(attachment, LazyAttachment)
+    assert dict(attachment) == {
+        "filename": "data.bin",
+        "content_type": "application/octet-stream",
+        "payload": payload,
+    }
+    assert b"".join(attachment.stream(chunk_size=1000)) == payload
+
+
+def test_email_data_spooled_attachment_round_trip():
+    """Test that spooled attachment payloads are read back when sending."""
+    payload = b"spooled content" * 100
+    attachments = [
+        {
+            "payload": payload,
+            "maintype": "application",
+            "subtype": "octet-stream",
+            "filename": "data.bin",
+        }
+    ]
+    msg = create_email_message(attachments=attachments)
+    attachment = EmailData.from_email_message(msg).attachments[0]
+
+    spooled = attachment.spool(max_size=64)
+    assert spooled.read() == payload
+
+    email_data = EmailData(
+        message_id="<test123@example.com>",
+        subject="Test Subject",
+        from_address="sender@example.com",
+        to_addresses=["recipient@example.com"],
+        body_text="See attached",
+        attachments=[
+            {
+                "filename": "data.bin",
+                "content_type": "application/octet-stream",
+                "payload": spooled,
+            }
+        ],
+    )
+    sent = email_data.to_email_message()
+
+    parts = list(sent.iter_attachments())
+    assert parts[0].get_content() == payload
+
+
+def test_email_data_text_attachment_keeps_body():
+    """Test that a text/plain attachment does not replace the message body."""
+    attachments = [
+        {
+            "payload": b"attachment text",
+            "maintype": "text",
+            "subtype": "plain",
+            "filename": "notes.txt",
+        }
+    ]
+    msg = create_email_message(body_text="Body text", attachments=attachments)
+    email_data = EmailData.from_email_message(msg)
+
+    assert email_data.attachments
+    assert email_data.body_text.rstrip() == "Body text"
+
+
 def test_email_data_to_simple_message():
     """Test converting EmailData to a simple text-only message."""
     email_data = EmailData(
@@ -142,6 +321,32 @@ def test_email_data_to_simple_message():
     assert msg.get_content().rstrip() == "Test message"
 
 
+def test_email_data_to_message_builds_new_message():
+    """Test that each message is built anew while the rendered HTML is reused."""
+    email_data = EmailData(
+        message_id="<test123@example.com>",
+        subject="Test Subject",
+        from_address="sender@example.com",
+        to_addresses=["recipient@example.com"],
+        body_text="# Heading",
+    )
+
+    msg = email_data.to_email_message()
+    msg["Bcc"] = "hidden@example.com"
+    assert email_data.to_email_message()["Bcc"] is None
+    assert email_data.html_content is email_data.html_content
+    assert "<h1>Heading</h1>" in email_data.html_content
+
+    email_data.to_addresses.append("other@example.com")
+    assert email_data.to_email_message()["To"] == (
+        "recipient@example.com, other@example.com"
+    )
+
+    email_data.body_text = "Plain text"
+    assert email_data.html_content is None
+    assert email_data.to_email_message().get_content().rstrip() == "Plain text"
+
+
 def test_email_data_to_html_message():
     """Test converting EmailData to a message with HTML content."""
     email_data = EmailData(
@@ -469,3 +674,33 @@ def test_create_reply_chain():
     reply3.message_id = "<reply3@example.com>"  # Simulate server setting message ID
     assert reply3.references == ["<original@example.com>",
                                  "<reply1@example.com>", "<reply2@example.com>"]
+
+
+def test_email_data_timestamp_iso():
+    """Test that the ISO timestamp follows reassignments of the timestamp."""
+    email_data = EmailData(
+        message_id="<test123@example.com>",
+        subject="Test Subject",
+        from_address="sender@example.com",
+        to_addresses=["recipient@example.com"],
+        timestamp=datetime(2024, 1, 1, 12, 0),
+    )
+    assert email_data.timestamp_iso == "2024-01-01T12:00:00"
+
+    email_data.timestamp = datetime(2024, 2, 1, 8, 30)
+    assert email_data.timestamp_iso == "2024-02-01T08:30:00"
+
+
+def test_from_email_message_indented_quotes():
+    """Test that quote markers indented by whitespace start a quote block."""
+    msg = EmailMessage()
+    msg["Message-ID"] = "<test123@example.com>"
+    msg["Subject"] = "Re: Test"
+    msg["From"] = "sender@example.com"
+    msg["To"] = "recipient@example.com"
+    msg.set_content("Reply\n> first\n \n  >> second")
+
+    email_data = EmailData.from_email_message(msg)
+
+    # The blank line between the two quote blocks is dropped
+    assert email_data.body_text == "Reply\n> first\n  >> second"
@@ -115,3 +115,17 @@ def test_no_markdown_conversion_without_markers():
     # Check if message is multipart (it shouldn't be)
     assert not msg.is_multipart()
     assert msg.get_content().strip() == plain_text.strip()
+
+
+def test_markdown_detected_for_each_marker():
+    """Test that any single markdown marker enables HTML conversion."""
+    for marker in ["```", "#", "**", "__", ">", "-"]:
+        email_data = EmailData(
+            message_id="test-id",
+            subject="Test Subject",
+            from_address="from@example.com",
+            to_addresses=["to@example.com"],
+            body_text=f"Plain text {marker} marker",
+        )
+
+        assert email_data.html_content is not None, marker
@@ -0,0 +1,69 @@
+"""Tests for the email tool schemas."""
+
+import json
+
+import pytest
+
+from pymailai.tools import (
+    get_email_tool_schema,
+    get_email_tool_schema_anthropic,
+    get_email_tool_schema_anthropic_json,
+    get_email_tool_schema_ollama,
+    get_email_tool_schema_ollama_json,
+    get_email_tool_schema_openai,
+    get_email_tool_schema_openai_json,
+)
+
+
+@pytest.mark.parametrize(
+    "get_schema",
+    [
+        get_email_tool_schema_anthropic,
+        get_email_tool_schema_openai,
+        get_email_tool_schema_ollama,
+    ],
+)
+def test_schema_built_once(get_schema):
+    """Test that every call returns the same read-only schema."""
+    schema = get_schema()
+
+    assert get_schema() is schema
+    with pytest.raises(TypeError):
+        schema[0]["name"] = "changed"
+    # Still serializable for the model APIs
+    assert len(json.loads(json.dumps(schema))) == len(schema)
+
+
+def test_schemas_share_parameters():
+    """Test that the provider schemas wrap the same parameter blocks."""
+    anthropic = get_email_tool_schema_anthropic()
+    openai = get_email_tool_schema_openai()
+
+    for anthropic_tool, openai_tool in zip(anthropic, openai):
+        assert anthropic_tool["name"] == openai_tool["function"]["name"]
+        assert anthropic_tool["input_schema"] is openai_tool["function"]["parameters"]
+
+
+@pytest.mark.parametrize(
+    "get_schema, get_json",
+    [
+        (get_email_tool_schema_anthropic, get_email_tool_schema_anthropic_json),
+        (get_email_tool_schema_openai, get_email_tool_schema_openai_json),
+        (get_email_tool_schema_ollama, get_email_tool_schema_ollama_json),
+    ],
+)
+def test_schema_json_matches_schema(get_schema, get_json):
+    """Test that the pre-encoded JSON decodes to the schema."""
+    encoded = get_json()
+
+    assert get_json() is encoded
+    assert json.loads(encoded) == json.loads(json.dumps(get_schema()))
+
+
+def test_get_email_tool_schema_by_provider():
+    """Test looking up schemas by provider name."""
+    assert get_email_tool_schema("anthropic") is get_email_tool_schema_anthropic()
+    assert get_email_tool_schema("openai") is get_email_tool_schema_openai()
+    assert get_email_tool_schema("ollama") is get_email_tool_schema_ollama()
+    with pytest.raises(ValueError, match="Unsupported provider"):
+        get_email_tool_schema("unknown")